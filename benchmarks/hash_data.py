@@ -18,7 +18,7 @@ from __future__ import annotations
 
 import compare_data
 
-from gemseo.utils.hash import hash_data
+from gemseo.caches.utils import hash_data
 
 
 class Benchmark(compare_data.Benchmark):
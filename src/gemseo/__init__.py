@@ -1953,6 +1953,7 @@ def configure(
     check_input_data: bool = True,
     check_output_data: bool = True,
     check_desvars_bounds: bool = True,
+    activate_doe_unit_samples_cache: bool = False,
 ) -> None:
     """Update the configuration of |g| if needed.
 
@@ -1982,7 +1983,11 @@ def configure(
             before execution.
         check_desvars_bounds: Whether to check the membership of design variables
             in the bounds when evaluating the functions in OptimizationProblem.
+        activate_doe_unit_samples_cache: Whether to cache the unit samples
+            generated by the DOE libraries supporting it,
+            to reuse them when a DOE is repeated in the same process.
     """
+    from gemseo.algos.doe.doe_library import DOELibrary
     from gemseo.algos.driver_library import DriverLibrary
     from gemseo.algos.optimization_problem import OptimizationProblem
     from gemseo.core.discipline import MDODiscipline
@@ -1995,6 +2000,7 @@ def configure(
     MDODiscipline.activate_output_data_check = check_output_data
     MDODiscipline.activate_cache = activate_discipline_cache
     OptimizationProblem.activate_bound_check = check_desvars_bounds
+    DOELibrary.activate_unit_samples_cache = activate_doe_unit_samples_cache
 
 
 def wrap_discipline_in_job_scheduler(
@@ -498,6 +498,26 @@ class Database(Mapping):
         if self.__new_iter_listeners and outputs and current_outputs_is_empty:
             self.notify_new_iter_listeners(x_vect)
 
+    def bulk_store_empty(self, x_vects: Iterable[DatabaseKeyType]) -> None:
+        """Store input values without output values.
+
+        This is equivalent to calling :meth:`.store` with empty outputs
+        for each input value but avoids the overhead of the per-call checks,
+        e.g. when reserving the order of the entries before a parallel execution.
+
+        Args:
+            x_vects: The input values.
+        """
+        data = self.__data
+        add_pending_array = self.__hdf_database.add_pending_array
+        store_listeners = self.__store_listeners
+        for x_vect in x_vects:
+            hashed_input_value = self.get_hashable_ndarray(x_vect, True)
+            add_pending_array(hashed_input_value)
+            data.setdefault(hashed_input_value, {})
+            if store_listeners:
+                self.notify_store_listeners(x_vect)
+
     def add_store_listener(self, function: ListenerType) -> bool:
         """Add a function to be called when an item is stored to the database.
 
@@ -60,6 +60,7 @@ from numpy import atleast_1d
 from numpy import bytes_
 from numpy import complex128
 from numpy import concatenate
+from numpy import copyto
 from numpy import dtype
 from numpy import empty
 from numpy import equal
@@ -76,11 +77,9 @@ from numpy import isnan
 from numpy import logical_or
 from numpy import mod
 from numpy import ndarray
-from numpy import ones_like
 from numpy import round
 from numpy import vectorize
 from numpy import where
-from numpy import zeros_like
 from strenum import StrEnum
 
 from gemseo.algos.optimization_result import OptimizationResult
@@ -233,6 +232,8 @@ class DesignSpace(collections.abc.MutableMapping):
         self.__no_integer = True
         self.__norm_data_is_computed = False
         self.__norm_inds = None
+        self.__unnorm_inds = None
+        self.__integer_variable_names = ()
         self.__to_zero = None
         self.__bound_tol = 100.0 * finfo(float64).eps
         self.__current_value = {}
@@ -1253,7 +1254,9 @@ class DesignSpace(collections.abc.MutableMapping):
         self.__lower_bounds_array = self.get_lower_bounds()
         self.__upper_bounds_array = self.get_upper_bounds()
         self._norm_factor = self.__upper_bounds_array - self.__lower_bounds_array
-        self.__norm_inds = self.dict_to_array(self.normalize).nonzero()[0]
+        normalize = self.dict_to_array(self.normalize)
+        self.__norm_inds = normalize.nonzero()[0]
+        self.__unnorm_inds = (normalize == 0).nonzero()[0]
         # In case lb=ub
         norm_factor_is_zero = self._norm_factor == 0.0
         self.__to_zero = norm_factor_is_zero.nonzero()[0]
@@ -1263,8 +1266,32 @@ class DesignSpace(collections.abc.MutableMapping):
             for variable_name in self.variable_names
         ])
         self.__no_integer = not self.__integer_components.any()
+        self.__integer_variable_names = tuple(
+            variable_name
+            for variable_name in self.variable_names
+            if self.variable_types[variable_name][0] == self.DesignVariableType.INTEGER
+        )
         self.__norm_data_is_computed = True
 
+    @property
+    def _unnormalized_components(self) -> NDArray[int]:
+        """The indices of the components that are not normalized.
+
+        These components are either unbounded or constant.
+        """
+        if not self.__norm_data_is_computed:
+            self.__update_normalization_vars()
+
+        return self.__unnorm_inds
+
+    @property
+    def _integer_variable_names(self) -> tuple[str, ...]:
+        """The names of the integer variables."""
+        if not self.__norm_data_is_computed:
+            self.__update_normalization_vars()
+
+        return self.__integer_variable_names
+
     def normalize_vect(
         self,
         x_vect: RealOrComplexArrayT,
@@ -2134,8 +2161,15 @@ class DesignSpace(collections.abc.MutableMapping):
 
     def to_complex(self) -> None:
         """Cast the current value to complex."""
-        for name, val in self.__current_value.items():
-            self.__current_value[name] = array(val, dtype=complex128)
+        current_value = self.__current_value
+        if all(
+            isinstance(val, ndarray) and val.dtype == complex128
+            for val in current_value.values()
+        ):
+            return
+
+        for name, val in current_value.items():
+            current_value[name] = array(val, dtype=complex128)
 
         self.__update_common_dtype()
 
@@ -2322,25 +2356,30 @@ class DesignSpace(collections.abc.MutableMapping):
 
         Args:
             normalized: If ``True``, then the vector is assumed to be normalized.
-            x_c: The vector to be projected onto the bounds.
+            x_c: The vector to be projected onto the bounds,
+                or several vectors stacked as the rows of a 2D array.
 
         Returns:
             The projected vector.
         """
-        if not self.__norm_data_is_computed:
-            self.__update_normalization_vars()
-        if not normalized:
+        x_p = array(x_c)
+        if normalized:
+            # The bounds of the unit hypercube are scalars;
+            # no need to allocate them.
+            l_b = 0.0
+            u_b = 1.0
+        else:
+            if not self.__norm_data_is_computed:
+                self.__update_normalization_vars()
+
             l_b = self.__lower_bounds_array
             u_b = self.__upper_bounds_array
-        else:
-            l_b = zeros_like(x_c)
-            u_b = ones_like(x_c)
-        x_p = array(x_c)
-        l_inds = (x_c < l_b).nonzero()
-        x_p[l_inds] = l_b[l_inds]
 
-        u_inds = (x_c > u_b).nonzero()
-        x_p[u_inds] = u_b[u_inds]
+        is_lower = x_p < l_b
+        is_upper = x_p > u_b
+        # The bounds are broadcast to the shape of x_p.
+        copyto(x_p, l_b, casting="unsafe", where=is_lower)
+        copyto(x_p, u_b, casting="unsafe", where=is_upper)
         return x_p
 
     def __contains__(
@@ -2517,6 +2556,9 @@ class DesignSpace(collections.abc.MutableMapping):
         - the upper bounds when the lower bounds are infinite,
         - zero when the lower and upper bounds are infinite.
         """
+        if self.__has_current_value:
+            return
+
         for name, value in self.items():
             if value.value is not None:
                 continue
@@ -23,10 +23,12 @@ from __future__ import annotations
 
 import logging
 from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
 from dataclasses import dataclass
-from functools import singledispatchmethod
-from multiprocessing import RLock
 from multiprocessing import current_process
+from threading import Lock
+from threading import RLock
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
@@ -34,15 +36,16 @@ from typing import ClassVar
 from typing import Final
 
 from numpy import array
+from numpy import ascontiguousarray
 from numpy import dtype
-from numpy import hstack
 from numpy import int32
-from numpy import where
+from numpy import ndarray
 
 from gemseo.algos.design_space import DesignSpace
 from gemseo.algos.driver_library import DriverDescription
 from gemseo.algos.driver_library import DriverLibrary
 from gemseo.algos.driver_library import DriverLibraryOptionType
+from gemseo.algos.hashable_ndarray import HashableNdarray
 from gemseo.algos.optimization_problem import EvaluationType
 from gemseo.algos.parameter_space import ParameterSpace
 from gemseo.core.parallel_execution.callable_parallel_execution import SUBPROCESS_NAME
@@ -50,7 +53,6 @@ from gemseo.core.parallel_execution.callable_parallel_execution import (
     CallableParallelExecution,
 )
 from gemseo.core.serializable import Serializable
-from gemseo.utils.locks import synchronized
 from gemseo.utils.seeder import Seeder
 
 if TYPE_CHECKING:
@@ -84,6 +86,8 @@ class DOELibrary(DriverLibrary, Serializable):
     """The design vector samples in the design space.
 
     The design space variable types stored as dtype metadata.
+    This metadata is shared by the rows of the array
+    and read by :class:`.MDODisciplineAdapter` to cast the discipline inputs.
 
     To access those in the unit hypercube,
     use :attr:`.unit_samples`.
@@ -100,7 +104,12 @@ class DOELibrary(DriverLibrary, Serializable):
     """
 
     lock: RLock
-    """The lock protecting database storage in multiprocessing."""
+    """A deprecated lock kept only for backward compatibility.
+
+    The library does not use it:
+    the results of the parallel evaluations are stored in the database
+    by the calling process, one at a time.
+    """
 
     EVAL_JAC = "eval_jac"
     N_PROCESSES = "n_processes"
@@ -116,15 +125,62 @@ class DOELibrary(DriverLibrary, Serializable):
 
     _NORMALIZE_DS = False
 
+    activate_unit_samples_cache: ClassVar[bool] = False
+    """Whether to cache the unit samples across the DOE executions of the process.
+
+    When activated,
+    the libraries supporting it reuse the unit samples
+    generated with the same algorithm, options, seed
+    and names and sizes of the design variables.
+    Only the arrays smaller than 1 MiB are cached,
+    and at most 16 of them,
+    so that the cache uses at most 16 MiB.
+    """
+
+    _CACHE_UNIT_SAMPLES: ClassVar[bool] = False
+    """Whether the library supports the cache of the unit samples.
+
+    A library can set it to ``True``
+    only when its unit samples depend on nothing else
+    than the algorithm name, the options, the seed
+    and the names and sizes of the design variables,
+    and when generating them has no side effect,
+    e.g. on a global random number generator.
+    """
+
+    __UNIT_SAMPLES_CACHE: ClassVar[
+        OrderedDict[tuple[Any, ...], tuple[RealArray, int]]
+    ] = OrderedDict()
+    """The unit samples and seed increments bound to the generation signatures."""
+
+    __UNIT_SAMPLES_CACHE_LOCK: Final[Lock] = Lock()
+    """The lock protecting the accesses to the cache of the unit samples."""
+
+    __UNIT_SAMPLES_CACHE_SIZE: Final[int] = 16
+    """The maximum number of unit samples arrays in the cache."""
+
+    __UNIT_SAMPLES_CACHE_MAX_NBYTES: Final[int] = 2**20
+    """The size in bytes above which a unit samples array is not cached."""
+
     __eval_jac: bool
     """Whether to evaluate the Jacobian."""
 
+    __hashable_samples: list[HashableNdarray]
+    """The samples wrapped as database keys during a parallel run.
+
+    They are hashed once and for all
+    instead of each time they are accessed in the database.
+    """
+
     # TODO: use DesignSpace enum once there are hashable.
     __DESIGN_VARIABLE_TYPE_TO_PYTHON_TYPE: Final[dict[str, type]] = {
         "float": float,
         "integer": int32,
     }
-    _ATTR_NOT_TO_SERIALIZE: ClassVar[set[str]] = {"lock"}
+    _ATTR_NOT_TO_SERIALIZE: ClassVar[set[str]] = {
+        "lock",
+        "_DOELibrary__hashable_samples",
+    }
 
     def __init__(self) -> None:  # noqa: D107
         super().__init__()
@@ -132,10 +188,12 @@ class DOELibrary(DriverLibrary, Serializable):
         self.unit_samples = array([])
         self._seeder = Seeder()
         self.__eval_jac = False
+        self.__hashable_samples = []
         self.lock = RLock()
 
     def _init_shared_memory_attrs_after(self) -> None:
         self.lock = RLock()
+        self.__hashable_samples = []
 
     @property
     def seed(self) -> int:
@@ -156,7 +214,11 @@ class DOELibrary(DriverLibrary, Serializable):
         self.__check_unnormalization_capability(design_space)
         super()._pre_run(problem, algo_name, **options)
         problem.stop_if_nan = False
-        self.unit_samples = self._generate_unit_samples(design_space, **options)
+        # The samples are read row by row to evaluate the functions
+        # and to hash the database keys, which requires contiguous rows.
+        self.unit_samples = ascontiguousarray(
+            self.__generate_unit_samples(design_space, **options)
+        )
         LOGGER.debug(
             (
                 "The DOE algorithm %s of %s has generated %s samples "
@@ -179,22 +241,107 @@ class DOELibrary(DriverLibrary, Serializable):
         """
         design_space = self.problem.design_space
         samples = design_space.untransform_vect(self.unit_samples, no_check=True)
-        variable_types = design_space.variable_types
-        unique_variable_types = {t[0] for t in variable_types.values()}
-        if len(unique_variable_types) > 1:
+        integer_variable_names = design_space._integer_variable_names
+        if 0 < len(integer_variable_names) < len(design_space.variable_names):
             # When the design space have both float and integer variables,
             # the samples array has the float dtype.
             # We record the integer variables types to later be able to restore the
             # proper data type.
-            python_var_types = {
-                name: self.__DESIGN_VARIABLE_TYPE_TO_PYTHON_TYPE[type_[0]]
-                for name, type_ in variable_types.items()
-                if type_[0] != DesignSpace.DesignVariableType.FLOAT
-            }
+            # The dtype is set once for the whole array and is shared by its rows;
+            # it is the only piece of information
+            # that reaches the disciplines through the functions of the problem.
+            python_var_types = dict.fromkeys(
+                integer_variable_names,
+                self.__DESIGN_VARIABLE_TYPE_TO_PYTHON_TYPE[
+                    DesignSpace.DesignVariableType.INTEGER
+                ],
+            )
             samples.dtype = dtype(samples.dtype, metadata=python_var_types)
 
         return samples
 
+    def __generate_unit_samples(
+        self, design_space: DesignSpace, **options: Any
+    ) -> RealArray:
+        """Generate the samples of the design vector in the unit hypercube, or reuse.
+
+        When :attr:`.activate_unit_samples_cache` and ``_CACHE_UNIT_SAMPLES``
+        are ``True``,
+        the samples are deterministic given the algorithm, the options,
+        the names and sizes of the design variables and the state of the seeder;
+        so they are cached from one call to another, even across instances.
+
+        Args:
+            design_space: The design space to be sampled.
+            **options: The options of the DOE algorithm.
+
+        Returns:
+            The samples of the design vector in the unit hypercube.
+        """
+        if not (self.activate_unit_samples_cache and self._CACHE_UNIT_SAMPLES):
+            return self._generate_unit_samples(design_space, **options)
+
+        try:
+            signature = (
+                self.__class__,
+                self.algo_name,
+                self._seeder.default_seed,
+                tuple(design_space.variable_sizes.items()),
+                self.__to_hashable(options),
+            )
+            hash(signature)
+        except TypeError:
+            return self._generate_unit_samples(design_space, **options)
+
+        cache = self.__UNIT_SAMPLES_CACHE
+        with self.__UNIT_SAMPLES_CACHE_LOCK:
+            cached_item = cache.get(signature)
+            if cached_item is not None:
+                cache.move_to_end(signature)
+
+        if cached_item is not None:
+            unit_samples, seed_increment = cached_item
+            # Keep the seeder in the state it would be without the cache.
+            self._seeder.default_seed += seed_increment
+            return unit_samples.copy()
+
+        seed = self._seeder.default_seed
+        unit_samples = self._generate_unit_samples(design_space, **options)
+        if unit_samples.nbytes > self.__UNIT_SAMPLES_CACHE_MAX_NBYTES:
+            return unit_samples
+
+        cached_item = (unit_samples.copy(), self._seeder.default_seed - seed)
+        with self.__UNIT_SAMPLES_CACHE_LOCK:
+            cache[signature] = cached_item
+            if len(cache) > self.__UNIT_SAMPLES_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        return unit_samples
+
+    @classmethod
+    def __to_hashable(cls, value: Any) -> Any:
+        """Convert a value to a hashable one.
+
+        Args:
+            value: The value.
+
+        Returns:
+            The hashable version of the value,
+            which may still be unhashable if it contains unsupported objects.
+        """
+        if isinstance(value, ndarray):
+            return value.dtype.str, value.shape, value.tobytes()
+
+        if isinstance(value, Mapping):
+            return tuple(
+                (key, cls.__to_hashable(item)) for key, item in sorted(value.items())
+            )
+
+        if isinstance(value, (list, tuple)):
+            return tuple(cls.__to_hashable(item) for item in value)
+
+        return value
+
     @abstractmethod
     def _generate_unit_samples(
         self, design_space: DesignSpace, **options: Any
@@ -237,7 +384,7 @@ class DOELibrary(DriverLibrary, Serializable):
             ``if __name__ == '__main__':`` statement when working on Windows.
         """  # noqa: D205, D212
         self.__eval_jac = eval_jac
-        callbacks = list(callbacks)
+        callbacks = tuple(callbacks)
         if n_processes > 1:
             LOGGER.info("Running DOE in parallel on n_processes = %s", n_processes)
             # Given a ndarray input value,
@@ -251,21 +398,29 @@ class DOELibrary(DriverLibrary, Serializable):
             database = self.problem.database
             if use_database:
                 # Add a callback to store the samples in the database on the fly.
-                callbacks.append(self.__store_in_database)
+                callbacks = (*callbacks, self.__store_in_database)
                 # Initialize the order of samples
                 # as parallel execution does not guarantee it.
-                for sample in self.samples:
-                    database.store(sample, {})
-
-            # The list of inputs of the tasks is the list of samples
+                self.__hashable_samples = [
+                    HashableNdarray(sample, copy=True) for sample in self.samples
+                ]
+                database.bulk_store_empty(self.__hashable_samples)
+
+            # The list of inputs of the tasks is the list of sample indices;
+            # the workers read the samples from their own copy of the library
+            # instead of receiving them through the task queue.
             # A callback function stores the samples on the fly
             # during the parallel execution.
-            parallel.execute(self.unit_samples, exec_callback=callbacks)
-            if use_database:
-                # We added empty entries by default to keep order in the database
-                # but when the DOE point is failed, this is not consistent
-                # with the serial exec, so we clean the DB
-                database.remove_empty_entries()
+            try:
+                parallel.execute(range(len(self.samples)), exec_callback=callbacks)
+            finally:
+                if use_database:
+                    # We added empty entries by default to keep order in the database
+                    # but when the DOE point is failed, this is not consistent
+                    # with the serial exec, so we clean the DB
+                    database.remove_empty_entries()
+                    # Release the samples now that the database holds them.
+                    self.__hashable_samples = []
 
         else:
             # Sequential execution
@@ -273,15 +428,16 @@ class DOELibrary(DriverLibrary, Serializable):
                 LOGGER.warning(
                     "Wait time between samples option is ignored in sequential run."
                 )
+            evaluate_functions = self.problem.evaluate_functions
             for index, input_data in enumerate(self.samples):
                 try:
-                    output_data, jacobian_data = self.problem.evaluate_functions(
-                        x_vect=input_data,
-                        eval_jac=self.__eval_jac,
-                        normalize=False,
+                    # The output and Jacobian data are passed as returned
+                    # without unpacking and repacking them.
+                    evaluation = evaluate_functions(
+                        x_vect=input_data, eval_jac=eval_jac, normalize=False
                     )
                     for callback in callbacks:
-                        callback(index, (output_data, jacobian_data))
+                        callback(index, evaluation)
                 except ValueError:  # noqa: PERF203
                     LOGGER.exception(
                         "Problem with evaluation of sample:"
@@ -291,11 +447,11 @@ class DOELibrary(DriverLibrary, Serializable):
 
         return self.get_optimum_from_database()
 
-    def _worker(self, sample: RealArray) -> EvaluationType:
+    def _worker(self, index: int) -> EvaluationType:
         """Wrap the evaluation of the functions for parallel execution.
 
         Args:
-            sample: A point from the unit hypercube.
+            index: The index of a point in :attr:`.samples`.
 
         Returns:
             The computed values.
@@ -305,13 +461,12 @@ class DOELibrary(DriverLibrary, Serializable):
             self.problem.database.clear_listeners()
 
         return self.problem.evaluate_functions(
-            x_vect=self.problem.design_space.untransform_vect(sample, no_check=True),
+            x_vect=self.samples[index],
             eval_jac=self.__eval_jac,
             eval_observables=True,
             normalize=False,
         )
 
-    @synchronized
     def __store_in_database(
         self,
         index: int,
@@ -319,6 +474,9 @@ class DOELibrary(DriverLibrary, Serializable):
     ) -> None:
         """Store the output and Jacobian data in the database.
 
+        This callback is called sequentially by the calling process
+        as the results of the workers arrive.
+
         Args:
             index: The sample index.
             output_and_jacobian_data: The output and Jacobian data.
@@ -328,7 +486,7 @@ class DOELibrary(DriverLibrary, Serializable):
             for output_name, jacobian in jacobian_data.items():
                 data[self.problem.database.get_gradient_name(output_name)] = jacobian
 
-        self.problem.database.store(self.samples[index], data)
+        self.problem.database.store(self.__hashable_samples[index], data)
 
     @classmethod
     def __check_unnormalization_capability(cls, design_space) -> None:
@@ -343,9 +501,9 @@ class DOELibrary(DriverLibrary, Serializable):
         if not cls._USE_UNIT_HYPERCUBE or isinstance(design_space, ParameterSpace):
             return
 
-        components = set(where(hstack(list(design_space.normalize.values())) == 0)[0])
-        if components:
-            msg = f"The components {components} of the design space are unbounded."
+        components = design_space._unnormalized_components
+        if components.size:
+            msg = f"The components {set(components)} of the design space are unbounded."
             raise ValueError(msg)
 
     def compute_doe(
@@ -380,54 +538,35 @@ class DOELibrary(DriverLibrary, Serializable):
         if self.driver_has_option(self.N_SAMPLES):
             options[self.N_SAMPLES] = n_samples
 
-        unit_samples = self._generate_unit_samples(
+        unit_samples = self.__generate_unit_samples(
             design_space,
             **self._update_algorithm_options(
                 initialize_options_grammar=False, **options
             ),
         )
-        if unit_sampling:
+        if unit_sampling or isinstance(variables_space, int):
+            # The design space built from a dimension is the unit hypercube.
             return unit_samples
 
         return design_space.untransform_vect(unit_samples, no_check=True)
 
-    @singledispatchmethod
-    def __get_design_space(self, design_space):
+    @staticmethod
+    def __get_design_space(design_space: DesignSpace | int) -> DesignSpace:
         """Return a design space.
 
         Args:
             design_space: Either a design space or a design space dimension.
 
         Returns:
-            A design space.
-        """
-        return design_space
-
-    @__get_design_space.register
-    def _(self, design_space: DesignSpace):
-        """Return a design space.
-
-        Args:
-            design_space: A design space
-
-        Returns:
-            The design space passed as argument.
-        """
-        return design_space
-
-    @__get_design_space.register
-    def _(self, design_space: int):
-        """Return a design space from a design space dimension.
-
-        Args:
-            design_space: A design space dimension.
-
-        Returns:
-            A design space
+            Either the design space passed as argument
+            or a design space
             containing a single variable called ``"x"``
             whose size is the dimension passed as argument
             and lower and upper bounds are 0 and 1 respectively.
         """
+        if not isinstance(design_space, int):
+            return design_space
+
         design_space_ = DesignSpace()
         design_space_.add_variable("x", size=design_space, l_b=0.0, u_b=1.0)
         return design_space_
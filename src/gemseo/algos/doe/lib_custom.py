@@ -34,8 +34,9 @@ from typing import Optional
 from typing import TextIO
 from typing import Union
 
-from numpy import apply_along_axis
+from numpy import load
 from numpy import ndarray
+from numpy import newaxis
 from numpy import vstack
 from pandas import read_csv
 
@@ -81,6 +82,10 @@ class CustomDOE(DOELibrary):
 
     _USE_UNIT_HYPERCUBE: ClassVar[bool] = False
 
+    __OPTIONS_ERROR_MESSAGE: Final[str] = (
+        "The algorithm CustomDOE requires either 'doe_file' or 'samples' as option."
+    )
+
     def __init__(self) -> None:  # noqa:D107
         super().__init__()
         name = self.__class__.__name__
@@ -120,7 +125,12 @@ class CustomDOE(DOELibrary):
         """Set the options.
 
         Args:
-            doe_file: The path to the file containing the input samples.
+            doe_file: The path to the file containing the input samples,
+                either a text file or a NumPy binary file with the extension ``.npy``.
+                The latter is read in memory-map mode,
+                without loading the whole file,
+                and the options ``delimiter``, ``comments`` and ``skiprows``
+                are ignored.
                 If ``None``, use ``samples``.
             samples: The input samples.
                 They must be at least a 2D-array,
@@ -172,6 +182,9 @@ class CustomDOE(DOELibrary):
 
         Args:
             doe_file: Either the file, the filename, or the generator to read.
+                A filename with the extension ``.npy`` is loaded as a NumPy binary file
+                in memory-map mode and the other arguments are ignored;
+                a 1D array is read as a single column.
             delimiter: The character used to separate values.
                 If ``None``, use whitespace.
             comments:  The characters or list of characters
@@ -180,12 +193,22 @@ class CustomDOE(DOELibrary):
             skiprows: Skip the first ``skiprows`` lines.
 
         Returns:
-            The samples.
+            The samples;
+            read-only memory-mapped samples in the case of a ``.npy`` file.
         """
         try:
+            if isinstance(doe_file, (str, Path)) and Path(doe_file).suffix == ".npy":
+                # The samples are mapped from the disk instead of being parsed.
+                samples = load(doe_file, mmap_mode="r")
+                if samples.ndim == 1:
+                    # As loadtxt(..., ndmin=2), a 1D array is a single column.
+                    samples = samples[:, newaxis]
+
+                return samples
+
             samples = read_csv(
                 doe_file,
-                delimiter=delimiter,
+                delimiter=r"\s+" if delimiter is None else delimiter,
                 skiprows=skiprows,
                 header=None,
                 comment=comments,
@@ -206,16 +229,12 @@ class CustomDOE(DOELibrary):
                 If the dimension of ``samples`` is different from the
                 one of the problem.
         """  # noqa: D205, D212, D415
-        error_message = (
-            "The algorithm CustomDOE requires "
-            "either 'doe_file' or 'samples' as option."
-        )
         samples = options.get(self.SAMPLES)
         dimension = design_space.dimension
         if samples is None:
             doe_file = options.get(self.DOE_FILE)
             if doe_file is None:
-                raise ValueError(error_message)
+                raise ValueError(self.__OPTIONS_ERROR_MESSAGE)
             samples = self.read_file(
                 doe_file,
                 comments=options[self.COMMENTS_KEYWORD],
@@ -223,7 +242,7 @@ class CustomDOE(DOELibrary):
                 skiprows=options[self.SKIPROWS_KEYWORD],
             )
         elif options.get(self.DOE_FILE) is not None:
-            raise ValueError(error_message)
+            raise ValueError(self.__OPTIONS_ERROR_MESSAGE)
 
         if isinstance(samples, Mapping):
             samples = design_space.dict_to_array(samples)
@@ -237,4 +256,4 @@ class CustomDOE(DOELibrary):
             )
             raise ValueError(msg)
 
-        return apply_along_axis(design_space.transform_vect, axis=1, arr=samples)
+        return design_space.transform_vect(samples)
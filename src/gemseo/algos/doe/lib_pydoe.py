@@ -106,6 +106,8 @@ class PyDOE(DOELibrary):
     CENTER_CC_KEYWORD = "center_cc"
     LIBRARY_NAME = "PyDOE"
 
+    _CACHE_UNIT_SAMPLES: ClassVar[bool] = True
+
     def __init__(self) -> None:  # noqa:D107
         super().__init__()
         for idx, algo in enumerate(self.ALGO_LIST):
@@ -27,9 +27,9 @@ from typing import ClassVar
 from typing import Optional
 from typing import Union
 
-from numpy import hstack
 from numpy import linspace
 from numpy import newaxis
+from numpy import where
 
 from gemseo.algos.doe.doe_library import DOEAlgorithmDescription
 from gemseo.algos.doe.doe_library import DOELibrary
@@ -50,6 +50,8 @@ class DiagonalDOE(DOELibrary):
     }
     LIBRARY_NAME = "GEMSEO"
 
+    _CACHE_UNIT_SAMPLES: ClassVar[bool] = True
+
     def __init__(self) -> None:  # noqa:D107
         super().__init__()
         for algo, description in self.__ALGO_DESC.items():
@@ -124,22 +126,13 @@ class DiagonalDOE(DOELibrary):
             reverse = []
 
         sizes = design_space.variable_sizes
-        name_by_index = {}
-        start = 0
-        for name in design_space.variable_names:
-            for index in range(start, start + sizes[name]):
-                name_by_index[index] = name
-            start += sizes[name]
-
-        samples = []
-        for index in range(design_space.dimension):
-            if str(index) in reverse or name_by_index[index] in reverse:
-                start = 1.0
-                end = 0.0
-            else:
-                start = 0.0
-                end = 1.0
-
-            samples.append(linspace(start, end, n_samples)[:, newaxis])
-
-        return hstack(samples)
+        names = [
+            name for name in design_space.variable_names for _ in range(sizes[name])
+        ]
+        is_reversed = [
+            str(index) in reverse or name in reverse for index, name in enumerate(names)
+        ]
+        # The samples of all the components are computed at once
+        # by broadcasting the diagonal and its reverse.
+        diagonal = linspace(0.0, 1.0, n_samples)[:, newaxis]
+        return where(is_reversed, diagonal[::-1], diagonal)
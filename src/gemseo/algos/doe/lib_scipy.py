@@ -80,6 +80,8 @@ class SciPyDOE(DOELibrary):
     LIBRARY_NAME: ClassVar[str] = "SciPy"
     OPTIONS_DIR: ClassVar[Path] = Path("options") / "scipy"
 
+    _CACHE_UNIT_SAMPLES: ClassVar[bool] = True
+
     __HALTON_ALGO_NAME: Final[str] = "Halton"
     __LHS_ALGO_NAME: Final[str] = "LHS"
     __MC_ALGO_NAME: Final[str] = "MC"
@@ -41,6 +41,7 @@ from collections.abc import Iterable
 from contextlib import nullcontext
 from dataclasses import dataclass
 from pathlib import Path
+from time import monotonic
 from time import time
 from typing import TYPE_CHECKING
 from typing import Any
@@ -51,6 +52,7 @@ from typing import Union
 from typing import overload
 
 from numpy import ndarray
+from numpy import vstack
 from strenum import StrEnum
 
 from gemseo.algos._progress_bars.custom_tqdm_progress_bar import LOGGER as TQDM_LOGGER
@@ -99,6 +101,25 @@ class DriverDescription(AlgorithmDescription):
     """Whether the optimization algorithm requires the gradient."""
 
 
+class _CommonOptionsGrammar:
+    """The grammar of the options common to the drivers, loaded on first access."""
+
+    __grammar: JSONGrammar | None
+    """The grammar, if loaded."""
+
+    def __init__(self) -> None:  # noqa: D107
+        self.__grammar = None
+
+    def __get__(self, instance: Any, owner: type) -> JSONGrammar:
+        if self.__grammar is None:
+            self.__grammar = JSONGrammar(
+                "DriverLibOptions",
+                file_path=Path(__file__).parent / "driver_lib_options.json",
+            )
+
+        return self.__grammar
+
+
 class DriverLibrary(AlgorithmLibrary):
     """Abstract class for driver library interfaces.
 
@@ -147,10 +168,7 @@ class DriverLibrary(AlgorithmLibrary):
     _ACTIVATE_PROGRESS_BAR_OPTION_NAME = "activate_progress_bar"
     """The name of the option to activate the progress bar in the optimization log."""
 
-    _COMMON_OPTIONS_GRAMMAR: ClassVar[JSONGrammar] = JSONGrammar(
-        "DriverLibOptions",
-        file_path=Path(__file__).parent / "driver_lib_options.json",
-    )
+    _COMMON_OPTIONS_GRAMMAR: ClassVar[JSONGrammar] = _CommonOptionsGrammar()
 
     __LOG_PROBLEM: Final[str] = "log_problem"
     """The name of the option to log the definition and result of the problem."""
@@ -159,6 +177,32 @@ class DriverLibrary(AlgorithmLibrary):
     """The name of the option to reset the iteration counters of the OptimizationProblem
     before each execution."""
 
+    __TERMINATION_MESSAGES: Final[dict[type[TerminationCriterion], str]] = {
+        MaxIterReachedException: "Maximum number of iterations reached.",
+        FunctionIsNan: (
+            "Function value or gradient or constraint is NaN, "
+            "and problem.stop_if_nan is set to True."
+        ),
+        DesvarIsNan: "Design variables are NaN.",
+        XtolReached: (
+            "Successive iterates of the design variables "
+            "are closer than xtol_rel or xtol_abs."
+        ),
+        FtolReached: (
+            "Successive iterates of the objective function "
+            "are closer than ftol_rel or ftol_abs."
+        ),
+        MaxTimeReached: "Maximum time reached: {max_time} seconds.",
+        KKTReached: (
+            "The KKT residual norm is smaller than the tolerance "
+            "kkt_tol_abs or kkt_tol_rel."
+        ),
+    }
+    """The messages of the termination criteria.
+
+    ``{max_time}`` is replaced by the maximum duration of the execution.
+    """
+
     activate_progress_bar: ClassVar[bool] = True
     """Whether to activate the progress bar in the optimization log."""
 
@@ -168,6 +212,12 @@ class DriverLibrary(AlgorithmLibrary):
     _start_time: float
     """The time at which the execution begins."""
 
+    __deadline: float
+    """The value of the monotonic clock after which the execution is stopped.
+
+    Only used when :attr:`._max_time` is positive.
+    """
+
     __log_problem: bool
     """Whether to log the definition and result of the problem."""
 
@@ -177,6 +227,9 @@ class DriverLibrary(AlgorithmLibrary):
     __progress_bar: BaseProgressBar
     """The progress bar used during the execution."""
 
+    __progress_bar_is_active: bool
+    """Whether the progress bar is not a dummy one."""
+
     __reset_iteration_counters: bool
     """Whether to reset the iteration counters of the OptimizationProblem before each
     execution."""
@@ -184,8 +237,11 @@ class DriverLibrary(AlgorithmLibrary):
     problem: OptimizationProblem
     """The optimization problem the driver library is bonded to."""
 
-    __new_iter_listeners: set[ListenerType]
-    """The functions to be called when a new iteration is stored to the database."""
+    __new_iter_listeners: list[ListenerType]
+    """The functions to be called when a new iteration is stored to the database.
+
+    The database already refuses duplicated listeners, so a list is enough.
+    """
 
     def __init__(self) -> None:  # noqa:D107
         super().__init__()
@@ -193,10 +249,11 @@ class DriverLibrary(AlgorithmLibrary):
         self.__activate_progress_bar = self.activate_progress_bar
         self._start_time = 0.0
         self._max_time = 0.0
+        self.__deadline = 0.0
         self.__reset_iteration_counters = True
         self.__log_problem = True
         self.__one_line_progress_bar = False
-        self.__new_iter_listeners = set()
+        self.__new_iter_listeners = []
 
     @classmethod
     def _get_unsuitability_reason(
@@ -211,6 +268,7 @@ class DriverLibrary(AlgorithmLibrary):
     def deactivate_progress_bar(self) -> None:
         """Deactivate the progress bar."""
         self.__progress_bar = DummyProgressBar()
+        self.__progress_bar_is_active = False
 
     def init_iter_observer(
         self,
@@ -242,10 +300,12 @@ class DriverLibrary(AlgorithmLibrary):
                 self.problem,
                 message,
             )
+            self.__progress_bar_is_active = True
         else:
             self.deactivate_progress_bar()
 
         self._start_time = time()
+        self.__deadline = monotonic() + self._max_time
 
     def new_iteration_callback(self, x_vect: ndarray) -> None:
         """Iterate the progress bar, implement the stop criteria.
@@ -257,12 +317,18 @@ class DriverLibrary(AlgorithmLibrary):
             MaxTimeReached: If the elapsed time is greater than the maximum
                 execution time.
         """
-        self.__progress_bar.set_objective_value(None, True)
+        # The calls to the dummy progress bar are avoided
+        # as this callback is called at each iteration.
+        progress_bar_is_active = self.__progress_bar_is_active
+        if progress_bar_is_active:
+            self.__progress_bar.set_objective_value(None, True)
+
         self.problem.current_iter += 1
-        if 0 < self._max_time < time() - self._start_time:
+        if self._max_time > 0 and monotonic() > self.__deadline:
             raise MaxTimeReached
 
-        self.__progress_bar.set_objective_value(x_vect)
+        if progress_bar_is_active:
+            self.__progress_bar.set_objective_value(x_vect)
 
     def finalize_iter_observer(self) -> None:
         """Finalize the iteration observer."""
@@ -333,15 +399,32 @@ class DriverLibrary(AlgorithmLibrary):
                 LOGGER.warning("%s", opt_result_str[1])
         LOGGER.info("%s", opt_result_str[2])
         if problem.design_space.dimension <= max_design_space_dimension_to_log:
-            log = MultiLineString()
-            log.indent()
-            log.indent()
-            log.add("Design space:")
+            self.__log_design_space(problem.design_space, "Design space:", 2)
+
+    @staticmethod
+    def __log_design_space(
+        design_space: DesignSpace, title: str, n_indentations: int
+    ) -> None:
+        """Log a design space.
+
+        The design space is not rendered when the log level is higher than INFO.
+
+        Args:
+            design_space: The design space.
+            title: The title of the log.
+            n_indentations: The number of indentations of the title.
+        """
+        if not LOGGER.isEnabledFor(logging.INFO):
+            return
+
+        log = MultiLineString()
+        for _ in range(n_indentations):
             log.indent()
-            for line in str(problem.design_space).split("\n")[1:]:
-                log.add(line)
-            log.dedent()
-            LOGGER.info("%s", log)
+        log.add(title)
+        log.indent()
+        log.extend(str(design_space).split("\n")[1:])
+        log.dedent()
+        LOGGER.info("%s", log)
 
     def _check_integer_handling(
         self,
@@ -425,6 +508,7 @@ class DriverLibrary(AlgorithmLibrary):
             raise ValueError(msg)
 
         self._check_algorithm(self.algo_name, problem)
+        description = self.descriptions[self.algo_name]
         self._check_integer_handling(problem.design_space, skip_int_check)
         activate_progress_bar = options.pop(
             self._ACTIVATE_PROGRESS_BAR_OPTION_NAME, None
@@ -442,9 +526,7 @@ class DriverLibrary(AlgorithmLibrary):
         self.__log_problem = options.pop(self.__LOG_PROBLEM, True)
 
         options = self._update_algorithm_options(**options)
-        self.internal_algo_name = self.descriptions[
-            self.algo_name
-        ].internal_algorithm_name
+        self.internal_algo_name = description.internal_algorithm_name
 
         problem.check()
         problem.preprocess_functions(
@@ -469,19 +551,14 @@ class DriverLibrary(AlgorithmLibrary):
         for listener in listeners:
             if problem.database.add_new_iter_listener(listener):
                 # The listener was not in the database.
-                self.__new_iter_listeners.add(listener)
+                self.__new_iter_listeners.append(listener)
 
         if self.__log_problem:
             LOGGER.info("%s", problem)
             if problem.design_space.dimension <= max_design_space_dimension_to_log:
-                log = MultiLineString()
-                log.indent()
-                log.add("over the design space:")
-                log.indent()
-                for line in str(problem.design_space).split("\n")[1:]:
-                    log.add(line)
-                log.dedent()
-                LOGGER.info("%s", log)
+                self.__log_design_space(
+                    problem.design_space, "over the design space:", 1
+                )
 
             progress_bar_title = "Solving optimization problem with algorithm %s:"
         else:
@@ -542,32 +619,14 @@ class DriverLibrary(AlgorithmLibrary):
         Args:
             error: The obtained error from the algorithm.
         """
-        if isinstance(error, TerminationCriterion):
-            message = ""
-            if isinstance(error, MaxIterReachedException):
-                message = "Maximum number of iterations reached."
-            elif isinstance(error, FunctionIsNan):
-                message = "Function value or gradient or constraint is NaN, "
-                message += "and problem.stop_if_nan is set to True."
-            elif isinstance(error, DesvarIsNan):
-                message = "Design variables are NaN."
-            elif isinstance(error, XtolReached):
-                message = "Successive iterates of the design variables "
-                message += "are closer than xtol_rel or xtol_abs."
-            elif isinstance(error, FtolReached):
-                message = "Successive iterates of the objective function "
-                message += "are closer than ftol_rel or ftol_abs."
-            elif isinstance(error, MaxTimeReached):
-                message = f"Maximum time reached: {self._max_time} seconds."
-            elif isinstance(error, KKTReached):
-                message = (
-                    "The KKT residual norm is smaller than the tolerance "
-                    "kkt_tol_abs or kkt_tol_rel."
-                )
-            message += " GEMSEO Stopped the driver"
-        else:
-            message = error.args[0]
-
+        message = ""
+        for cls in type(error).__mro__:
+            template = self.__TERMINATION_MESSAGES.get(cls)
+            if template is not None:
+                message = template.format(max_time=self._max_time)
+                break
+
+        message += " GEMSEO Stopped the driver"
         return self.get_optimum_from_database(message)
 
     def get_optimum_from_database(
@@ -630,8 +689,10 @@ class DriverLibrary(AlgorithmLibrary):
             )
 
         current_value = self.problem.get_x0_normalized(True, as_dict)
-        lower_bounds = space.normalize_vect(space.get_lower_bounds())
-        upper_bounds = space.normalize_vect(space.get_upper_bounds())
+        # The bounds are normalized at once as the rows of a single array.
+        lower_bounds, upper_bounds = space.normalize_vect(
+            vstack((space.get_lower_bounds(), space.get_upper_bounds()))
+        )
         if not as_dict:
             return current_value, lower_bounds, upper_bounds
 
@@ -651,10 +712,26 @@ class DriverLibrary(AlgorithmLibrary):
         Returns:
             A function calling the original function
             with the input data projected onto the design space.
+            When the original function is vectorized,
+            this function can be called with several design vectors
+            stacked as the rows of a 2D array;
+            they are projected at once.
         """
+        design_space = self.problem.design_space
 
         def wrapped_func(x_vect):
-            x_proj = self.problem.design_space.project_into_bounds(x_vect, normalize)
-            return orig_func(x_proj)
+            if normalize:
+                lower_bounds = 0.0
+                upper_bounds = 1.0
+            else:
+                lower_bounds = design_space.get_lower_bounds()
+                upper_bounds = design_space.get_upper_bounds()
+
+            # Most of the design vectors are inside the bounds;
+            # checking it is cheaper than copying and projecting them.
+            if (x_vect >= lower_bounds).all() and (x_vect <= upper_bounds).all():
+                return orig_func(x_vect)
+
+            return orig_func(design_space.project_into_bounds(x_vect, normalize))
 
         return wrapped_func
@@ -25,6 +25,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 from typing import ClassVar
+from warnings import catch_warnings
+from warnings import simplefilter
 
 import numpy as np
 from numpy import abs as np_abs
@@ -32,12 +34,20 @@ from numpy import arange
 from numpy import array
 from numpy import atleast_2d
 from numpy import concatenate
+from numpy import flatnonzero
+from numpy import full
 from numpy import isinf
 from numpy import ndarray
+from numpy import result_type
 from numpy import zeros
 from numpy.linalg import norm
+from scipy.linalg import LinAlgError
+from scipy.linalg import LinAlgWarning
+from scipy.linalg import solve
 from scipy.optimize import lsq_linear
 from scipy.optimize import nnls
+from scipy.sparse import coo_array
+from scipy.sparse import issparse
 
 from gemseo.algos.design_space import DesignSpace
 from gemseo.third_party.prettytable import PrettyTable
@@ -94,6 +104,12 @@ class LagrangeMultipliers:
     """The maximum constraint violation (taking tolerances into account), ``None`` if
     not computed."""
 
+    __design_space: DesignSpace
+    """The design space of the optimization problem."""
+
+    __rendered_multipliers: tuple[dict[str, tuple[list[str], ndarray]] | None, str]
+    """The Lagrange multipliers last rendered as a string and this string."""
+
     LOWER_BOUNDS = "lower_bounds"
     UPPER_BOUNDS = "upper_bounds"
     INEQUALITY = "inequality"
@@ -112,6 +128,7 @@ class LagrangeMultipliers:
                 on which Lagrange multipliers shall be computed.
         """  # noqa: D205, D212, D415
         self.optimization_problem = opt_problem
+        self.__design_space = opt_problem.design_space
         self.optimization_problem.reset(
             database=False, design_space=False, preprocessing=False
         )
@@ -125,6 +142,7 @@ class LagrangeMultipliers:
         )
         self.kkt_residual = None
         self.constraint_violation = None
+        self.__rendered_multipliers = (None, "")
 
     def compute(
         self, x_vect: ndarray, ineq_tolerance: float = 1e-6, rcond: float = -1
@@ -150,12 +168,13 @@ class LagrangeMultipliers:
 
         # Check feasibility
         self._check_feasibility(x_vect)
+        normalized_x_vect = self.__normalize(x_vect)
         # get jacobian of objective
-        rhs = -self.get_objective_jacobian(x_vect).T
+        rhs = -self.optimization_problem.objective.jac(normalized_x_vect).T
         # get jacobian of all active constraints, and an
         # ordered list of their name
-        self.__compute_constraint_violation(x_vect)
-        jac_act, _ = self._get_jac_act(x_vect, ineq_tolerance)
+        self.__compute_constraint_violation(normalized_x_vect)
+        jac_act, _ = self._get_jac_act(x_vect, ineq_tolerance, normalized_x_vect)
         if jac_act is None:
             # There is no active constraint
             multipliers = []
@@ -167,7 +186,11 @@ class LagrangeMultipliers:
         # Compute the Lagrange multipliers as a feasible solution of a
         # linear optimization problem
         act_eq_constr_nb = len(self.active_eq_names)
-        if act_eq_constr_nb == 0:
+        mul = self.__solve_square_system(lhs, rhs, act_constr_nb - act_eq_constr_nb)
+        if mul is not None:
+            self.kkt_residual = norm(lhs @ mul - rhs)
+            LOGGER.info("Residuals norm = %s", self.kkt_residual)
+        elif act_eq_constr_nb == 0:
             # If the linear optimization failed then obtain the Lagrange
             # multipliers as a solution of a least-square problem
             mul, residuals = nnls(lhs, rhs)
@@ -189,13 +212,46 @@ class LagrangeMultipliers:
 
         return self.lagrange_multipliers
 
+    @staticmethod
+    def __solve_square_system(
+        lhs: ndarray, rhs: ndarray, n_signed: int
+    ) -> ndarray | None:
+        """Solve the KKT system directly when it is square and well-conditioned.
+
+        Args:
+            lhs: The left-hand side of the KKT system.
+            rhs: The right-hand side of the KKT system.
+            n_signed: The number of multipliers that must be non-negative,
+                i.e. the leading ones associated with bounds and inequalities.
+
+        Returns:
+            The unique solution of the KKT system
+            if it is square and well-conditioned
+            and if its multipliers satisfy the sign conditions,
+            ``None`` otherwise.
+        """
+        if lhs.shape[0] != lhs.shape[1]:
+            return None
+
+        with catch_warnings():
+            simplefilter("error", LinAlgWarning)
+            try:
+                mul = solve(lhs, rhs)
+            except (LinAlgError, LinAlgWarning):
+                return None
+
+        if (mul[:n_signed] < 0.0).any():
+            return None
+
+        return mul
+
     def _check_feasibility(self, x_vect: ndarray) -> None:
         """Check that a point is in the design space and satisfies all the constraints.
 
         Args:
             x_vect: The point at which the Lagrange multipliers are to be computed.
         """
-        self.optimization_problem.design_space.check_membership(x_vect)
+        self.__design_space.check_membership(x_vect)
 
         # Check that the point satisfies other constraints
         values, _ = self.optimization_problem.evaluate_functions(
@@ -204,49 +260,62 @@ class LagrangeMultipliers:
         if not self.optimization_problem.is_point_feasible(values):
             LOGGER.warning("Infeasible point, Lagrange multipliers may not exist.")
 
-    def _get_act_bound_jac(self, act_bounds: dict[str, ndarray]):
+    def _get_act_bound_jac(
+        self,
+        act_bounds: dict[str, ndarray],
+        indexed_variable_names: ndarray,
+        sign: float = 1.0,
+        norm_factor: ndarray | None = None,
+    ):
         """Return the Jacobian of the active bounds.
 
-        The constraints sign is not taken into account (matrix is made of 0 and 1).
-
         Args:
             act_bounds: The active bounds.
+            indexed_variable_names: The names of the components of the variables.
+            sign: The sign of the constraints,
+                e.g. ``-1.0`` for the lower bounds and ``1.0`` for the upper bounds.
+            norm_factor: The normalization factors of the components of the variables
+                when the functions take normalized inputs, ``None`` otherwise.
 
         Returns:
-            The Jacobian of the active bounds
+            The Jacobian of the active bounds as a sparse array
             and the name of each component of each function.
         """
-        dspace = self.optimization_problem.design_space
+        dspace = self.__design_space
         x_dim = dspace.dimension
-        dim_act = sum(len(bnd.nonzero()[0]) for bnd in act_bounds.values())
+        act_array = concatenate([act_bounds[var] for var in dspace.variable_names])
+        dim_act = int(act_array.sum())
         if dim_act == 0:
             return None, []
-        act_array = concatenate([act_bounds[var] for var in dspace.variable_names])
 
-        bnd_jac = zeros((dim_act, x_dim))
-
-        if self.__normalized:
-            norm_factor = dspace.get_upper_bounds() - dspace.get_lower_bounds()
-            norm_factor[isinf(norm_factor)] = 1.0
-            act_jac = norm_factor[act_array]
+        if norm_factor is None:
+            act_jac = full(dim_act, sign)
         else:
-            act_jac = 1.0
-        bnd_jac[arange(dim_act), act_array] = act_jac
-        indexed_varnames = array(dspace.get_indexed_variable_names())
-        act_b_names = indexed_varnames[act_array].tolist()
+            act_jac = sign * norm_factor[act_array]
+
+        bnd_jac = coo_array(
+            (act_jac, (arange(dim_act), flatnonzero(act_array))),
+            shape=(dim_act, x_dim),
+        )
+        act_b_names = indexed_variable_names[act_array].tolist()
         return bnd_jac, act_b_names
 
     def __get_act_ineq_jac(
-        self, x_vect: ndarray, ineq_tolerance: float = 1e-6
-    ) -> tuple[ndarray, list[str]]:
+        self,
+        x_vect: ndarray,
+        normalized_x_vect: ndarray,
+        ineq_tolerance: float = 1e-6,
+    ) -> tuple[list[ndarray], list[str]]:
         """Return the Jacobian of the active inequality constraints.
 
         Args:
             x_vect: The point at which the Jacobian is computed.
+            normalized_x_vect: The point at which the Jacobian is computed,
+                normalized if the functions take normalized inputs.
             ineq_tolerance: The tolerance for the inequality constraints.
 
         Returns:
-            The Jacobian of the active inequality constraints
+            The Jacobians of the active inequality constraints, one per function,
             and the name of each component of each function.
         """
         # retrieves the active functions and the indices :
@@ -256,42 +325,38 @@ class LagrangeMultipliers:
         act_constraints = self.optimization_problem.get_active_ineq_constraints(
             x_vect, ineq_tolerance
         )
-        dspace = self.optimization_problem.design_space
-
-        if self.__normalized:
-            x_vect = dspace.normalize_vect(x_vect)
         jac = []
         names = []
 
         for func, act_set in act_constraints.items():
-            if act_set.any():
-                ineq_jac = func.jac(x_vect)
-                if len(ineq_jac.shape) == 1:
-                    # Make sure the Jacobian is a 2-dimensional array
-                    ineq_jac = ineq_jac.reshape((1, x_vect.size))
-                else:
-                    ineq_jac = ineq_jac[act_set, :]
-                jac.append(ineq_jac)
-                if func.dim == 1:
-                    names.append(func.name)
-                else:
-                    names += [
-                        self._get_component_name(func.name, i)
-                        for i, active in enumerate(act_set)
-                        if active
-                    ]
-        jac = concatenate(jac) if jac else None
+            active_indices = flatnonzero(act_set)
+            if active_indices.size == 0:
+                continue
+
+            ineq_jac = func.jac(normalized_x_vect)
+            if len(ineq_jac.shape) == 1:
+                # Make sure the Jacobian is a 2-dimensional array
+                ineq_jac = ineq_jac.reshape((1, x_vect.size))
+            else:
+                ineq_jac = ineq_jac[active_indices, :]
+            jac.append(ineq_jac)
+            if func.dim == 1:
+                names.append(func.name)
+            else:
+                names.extend(
+                    self._get_component_name(func.name, index)
+                    for index in active_indices
+                )
         return jac, names
 
     def __compute_constraint_violation(self, x_vect: ndarray) -> None:
         """Compute the maximum constraint violation.
 
         Args:
-            x_vect: The point where the maximum constraint violation is to be computed.
+            x_vect: The point where the maximum constraint violation is to be computed,
+                normalized if the functions take normalized inputs.
         """
         self.constraint_violation = 0.0
-        if self.__normalized:
-            x_vect = self.optimization_problem.design_space.normalize_vect(x_vect)
         for constraint in self.optimization_problem.constraints:
             value = constraint(x_vect)
             if constraint.f_type == constraint.ConstraintType.EQ:
@@ -304,14 +369,15 @@ class LagrangeMultipliers:
 
         self.constraint_violation = max(self.constraint_violation, 0.0)
 
-    def _get_act_eq_jac(self, x_vect: ndarray) -> tuple[ndarray, list[str]]:
+    def _get_act_eq_jac(self, x_vect: ndarray) -> tuple[list[ndarray], list[str]]:
         """Return The Jacobian of the active equality constraints.
 
         Args:
-            x_vect: The point at which the Jacobian is computed.
+            x_vect: The point at which the Jacobian is computed,
+                normalized if the functions take normalized inputs.
 
         Returns:
-            The Jacobian of the active equality constraints
+            The Jacobians of the active equality constraints, one per function,
             and the name of each component of each function.
         """
         eq_functions = self.optimization_problem.get_eq_constraints()
@@ -320,11 +386,6 @@ class LagrangeMultipliers:
         # all functions (on all dimensions) are supposed to be active
         jac = []
         names = []
-        dspace = self.optimization_problem.design_space
-
-        if self.__normalized:
-            x_vect = dspace.normalize_vect(x_vect)
-
         for eq_function in eq_functions:
             eq_jac = atleast_2d(eq_function.jac(x_vect))
             jac.append(eq_jac)
@@ -335,7 +396,6 @@ class LagrangeMultipliers:
                     self._get_component_name(eq_function.name, i)
                     for i in range(eq_jac.shape[0])
                 ]
-        jac = concatenate(jac) if jac else None
         return jac, names
 
     def get_objective_jacobian(self, x_vect: ndarray) -> ndarray:
@@ -347,37 +407,68 @@ class LagrangeMultipliers:
         Returns:
             The Jacobian of the objective.
         """
+        return self.optimization_problem.objective.jac(self.__normalize(x_vect))
+
+    def __normalize(self, x_vect: ndarray) -> ndarray:
+        """Normalize a point if the functions take normalized inputs.
+
+        Args:
+            x_vect: The point.
+
+        Returns:
+            The point, normalized if the functions take normalized inputs.
+        """
         if self.__normalized:
-            x_vect = self.optimization_problem.design_space.normalize_vect(x_vect)
+            return self.__design_space.normalize_vect(x_vect)
 
-        return self.optimization_problem.objective.jac(x_vect)
+        return x_vect
 
     def _get_jac_act(
-        self, x_vect: ndarray, ineq_tolerance: float = 1e-6
+        self,
+        x_vect: ndarray,
+        ineq_tolerance: float = 1e-6,
+        normalized_x_vect: ndarray | None = None,
     ) -> tuple[ndarray | None, list[str]]:
         """Return the Jacobian of the active constraints.
 
         Args:
             x_vect: The point at which the Jacobian is computed.
             ineq_tolerance: The tolerance for the inequality constraints.
+            normalized_x_vect: The point at which the Jacobian is computed,
+                normalized if the functions take normalized inputs.
+                If ``None``, compute it from ``x_vect``.
 
         Returns:
             The Jacobian of the active constraints
             and the name of each component of each function.
         """
         # Bounds jacobian
-        dspace = self.optimization_problem.design_space
+        dspace = self.__design_space
+        if normalized_x_vect is None:
+            normalized_x_vect = self.__normalize(x_vect)
+
         act_lb, act_ub = dspace.get_active_bounds(x_vect, tol=ineq_tolerance)
-        lb_jac_act, self.active_lb_names = self._get_act_bound_jac(act_lb)
-        if lb_jac_act is not None:
-            lb_jac_act *= -1
-        ub_jac_act, self.active_ub_names = self._get_act_bound_jac(act_ub)
+        indexed_variable_names = array(dspace.get_indexed_variable_names())
+        if self.__normalized:
+            norm_factor = dspace.get_upper_bounds() - dspace.get_lower_bounds()
+            norm_factor[isinf(norm_factor)] = 1.0
+        else:
+            norm_factor = None
+
+        lb_jac_act, self.active_lb_names = self._get_act_bound_jac(
+            act_lb, indexed_variable_names, sign=-1.0, norm_factor=norm_factor
+        )
+        ub_jac_act, self.active_ub_names = self._get_act_bound_jac(
+            act_ub, indexed_variable_names, norm_factor=norm_factor
+        )
 
         # inequality names
         tol = ineq_tolerance
-        ineq_jac, self.active_ineq_names = self.__get_act_ineq_jac(x_vect, tol)
+        ineq_jac, self.active_ineq_names = self.__get_act_ineq_jac(
+            x_vect, normalized_x_vect, tol
+        )
         # equality names
-        eq_jac, eq_names_act = self._get_act_eq_jac(x_vect)
+        eq_jac, eq_names_act = self._get_act_eq_jac(normalized_x_vect)
         self.active_eq_names = eq_names_act
 
         names = (
@@ -388,16 +479,29 @@ class LagrangeMultipliers:
         )
 
         jacobians = [
-            jacobian
-            for jacobian in [lb_jac_act, ub_jac_act, ineq_jac, eq_jac]
-            if jacobian is not None
+            jacobian for jacobian in [lb_jac_act, ub_jac_act] if jacobian is not None
         ]
+        jacobians.extend(ineq_jac)
+        jacobians.extend(eq_jac)
+        if not jacobians:
+            # There no active constraint
+            return None, names
+
+        # Write the Jacobians of the functions into a single preallocated array;
+        # the Jacobians of the bounds are sparse.
+        jac_act = zeros(
+            (sum(jacobian.shape[0] for jacobian in jacobians), dspace.dimension),
+            dtype=result_type(*(jacobian.dtype for jacobian in jacobians)),
+        )
+        start = 0
+        for jacobian in jacobians:
+            if issparse(jacobian):
+                jac_act[start + jacobian.row, jacobian.col] = jacobian.data
+            else:
+                jac_act[start : start + jacobian.shape[0]] = jacobian
+            start += jacobian.shape[0]
 
-        if jacobians:
-            return concatenate(jacobians, axis=0), names
-
-        # There no active constraint
-        return None, names
+        return jac_act, names
 
     def _store_multipliers(self, multipliers: ndarray) -> None:
         """Store the Lagrange multipliers in the attribute :attr:`lagrange_multipliers`.
@@ -406,153 +510,83 @@ class LagrangeMultipliers:
             multipliers: The Lagrange multipliers.
         """
         lag = {}
-
         i_min = 0
-        n_act = len(self.active_lb_names)
-        if n_act > 0:
-            l_b_mult = multipliers[i_min : i_min + n_act]
-            lag[self.LOWER_BOUNDS] = (self.active_lb_names, l_b_mult)
+        for label, names, description in (
+            (self.LOWER_BOUNDS, self.active_lb_names, "lower bounds on variables"),
+            (self.UPPER_BOUNDS, self.active_ub_names, "upper bounds on variables"),
+            (self.INEQUALITY, self.active_ineq_names, "inequality constraints"),
+            (self.EQUALITY, self.active_eq_names, ""),
+        ):
+            n_act = len(names)
+            if n_act == 0:
+                continue
+
+            label_multipliers = multipliers[i_min : i_min + n_act]
+            lag[label] = (names, label_multipliers)
             i_min += n_act
-            wrong_inds = (l_b_mult < 0.0).nonzero()[0]
-            if wrong_inds.size > 0:
-                names_neg = array(self.active_lb_names)[wrong_inds]
-                LOGGER.warning(
-                    "Negative Lagrange multipliers for "
-                    "lower bounds on variables"
-                    "%s !",
-                    str(names_neg),
-                )
-        n_act = len(self.active_ub_names)
-        if n_act > 0:
-            u_b_mult = multipliers[i_min : i_min + n_act]
-            lag[self.UPPER_BOUNDS] = (self.active_ub_names, u_b_mult)
-            i_min += n_act
-            wrong_inds = (u_b_mult < 0.0).nonzero()[0]
-            if wrong_inds.size > 0:
-                names_neg = array(self.active_ub_names)[wrong_inds]
-                LOGGER.warning(
-                    "Negative Lagrange multipliers for "
-                    "upper bounds on variables"
-                    "%s !",
-                    str(names_neg),
-                )
-        n_act = len(self.active_ineq_names)
-        if n_act > 0:
-            ineq_mult = multipliers[i_min : i_min + n_act]
-            lag[self.INEQUALITY] = (self.active_ineq_names, ineq_mult)
-            i_min += n_act
-            wrong_inds = (ineq_mult < 0.0).nonzero()[0]
-            if wrong_inds.size > 0:
-                names_neg = array(self.active_ineq_names)[wrong_inds]
+            if label == self.EQUALITY:
+                continue
+
+            # The names are cast to an array only when a warning is logged.
+            is_negative = label_multipliers < 0.0
+            if is_negative.any():
                 LOGGER.warning(
-                    "Negative Lagrange multipliers for "
-                    "inequality constraints"
-                    "%s !",
-                    str(names_neg),
+                    "Negative Lagrange multipliers for %s%s !",
+                    description,
+                    str(array(names)[is_negative]),
                 )
-        n_act = len(self.active_eq_names)
-        if n_act > 0:
-            lag[self.EQUALITY] = (
-                self.active_eq_names,
-                multipliers[i_min : i_min + n_act],
-            )
-            i_min += n_act
 
         self.lagrange_multipliers = lag
 
-    def _initialize_multipliers(self) -> dict[str, dict[str, ndarray]]:
-        """Initialize the Lagrange multipliers with zeros.
-
-        Returns:
-            The Lagrange multipliers.
-        """
-        problem = self.optimization_problem
-        multipliers = {}
-
-        # Bound-constraints
-        indexed_varnames = problem.design_space.get_indexed_variable_names()
-        multipliers[self.LOWER_BOUNDS] = dict.fromkeys(indexed_varnames, 0.0)
-        multipliers[self.UPPER_BOUNDS] = dict.fromkeys(indexed_varnames, 0.0)
-
-        # Inequality-constraints
-        multipliers[self.INEQUALITY] = {
-            func.name if func.dim == 1 else self._get_component_name(func.name, i): 0.0
-            for func in problem.get_ineq_constraints()
-            for i in range(func.dim)
-        }
-
-        # Equality-constraints
-        multipliers[self.EQUALITY] = {
-            func.name if func.dim == 1 else self._get_component_name(func.name, i): 0.0
-            for func in problem.get_eq_constraints()
-            for i in range(func.dim)
-        }
-
-        return multipliers
-
     def get_multipliers_arrays(self) -> dict[str, dict[str, ndarray]]:
         """Return the Lagrange multipliers (zero and nonzero) as arrays.
 
         Returns:
-            The Lagrange multipliers.
+            The Lagrange multipliers;
+            the lower and upper bound multipliers of a design variable
+            have the size of this variable.
         """
         problem = self.optimization_problem
-        design_space = problem.design_space
+        design_space = self.__design_space
+        indexed_variable_names = design_space.get_indexed_variable_names()
+        component_indices = {
+            name: index for index, name in enumerate(indexed_variable_names)
+        }
+        variable_indices = {
+            name: design_space.get_variables_indexes([name])
+            for name in design_space.variable_names
+        }
+        mult_arrays = {}
 
-        # Convert to dictionaries
-        multipliers = {}
-        for label in self.CSTR_LABELS:
+        # Bound-constraints multipliers:
+        # scatter the nonzero ones into an array of zeros and split it by variable.
+        for label in [self.LOWER_BOUNDS, self.UPPER_BOUNDS]:
             names, mults = self.lagrange_multipliers.get(label, ([], array([])))
-            multipliers[label] = dict(zip(names, mults))
-
-        # Add the Lagrange multipliers equal to zero
-        multipliers_init = self._initialize_multipliers()
-        for label in self.CSTR_LABELS:
-            multipliers_init[label].update(multipliers[label])
-
-        # Cast the multipliers as arrays
-        mult_arrays = {}
-        # Bound-constraints multipliers
-        mult_arrays[self.LOWER_BOUNDS] = {}
-        mult_arrays[self.UPPER_BOUNDS] = {}
-        for name in design_space.variable_names:
-            indexed_varnames = design_space.get_indexed_variable_names()
-            var_low_mult = array([
-                multipliers_init[self.LOWER_BOUNDS][comp_name]
-                for comp_name in indexed_varnames
-            ])
-            mult_arrays[self.LOWER_BOUNDS][name] = var_low_mult
-            var_upp_mult = array([
-                multipliers_init[self.UPPER_BOUNDS][comp_name]
-                for comp_name in indexed_varnames
-            ])
-            mult_arrays[self.UPPER_BOUNDS][name] = var_upp_mult
-        # Inequality-constraints multipliers
-        ineq_mult = multipliers_init[self.INEQUALITY]
-        mult_arrays[self.INEQUALITY] = {}
-        for func in problem.get_ineq_constraints():
-            func_mult = array([
-                ineq_mult[
-                    func.name
-                    if func.dim == 1
-                    else self._get_component_name(func.name, index)
-                ]
-                for index in range(func.dim)
-            ])
-            mult_arrays[self.INEQUALITY][func.name] = func_mult
-        # Equality-constraints multipliers
-        eq_mult = multipliers_init[self.EQUALITY]
-        mult_arrays[self.EQUALITY] = {}
-        for func in problem.get_eq_constraints():
-            func_mult = array([
-                eq_mult[
-                    func.name
-                    if func.dim == 1
-                    else self._get_component_name(func.name, index)
-                ]
-                for index in range(func.dim)
-            ])
-            mult_arrays[self.EQUALITY][func.name] = func_mult
+            bound_mult = zeros(len(indexed_variable_names))
+            bound_mult[[component_indices[name] for name in names]] = mults
+            mult_arrays[label] = {
+                name: bound_mult[indices] for name, indices in variable_indices.items()
+            }
+
+        # Inequality- and equality-constraints multipliers
+        for label, functions in [
+            (self.INEQUALITY, problem.get_ineq_constraints()),
+            (self.EQUALITY, problem.get_eq_constraints()),
+        ]:
+            names, mults = self.lagrange_multipliers.get(label, ([], array([])))
+            nonzero_mult = dict(zip(names, mults))
+            mult_arrays[label] = {
+                func.name: array([
+                    nonzero_mult.get(
+                        func.name
+                        if func.dim == 1
+                        else self._get_component_name(func.name, index),
+                        0.0,
+                    )
+                    for index in range(func.dim)
+                ])
+                for func in functions
+            }
 
         return mult_arrays
 
@@ -584,4 +618,10 @@ class LagrangeMultipliers:
         return table
 
     def __str__(self, *args, **kwargs) -> str:
-        return f"Lagrange multipliers:\n{self._get_pretty_table().get_string()}"
+        # The table is rendered again only when new multipliers have been stored.
+        multipliers, string = self.__rendered_multipliers
+        if multipliers is None or multipliers is not self.lagrange_multipliers:
+            string = f"Lagrange multipliers:\n{self._get_pretty_table().get_string()}"
+            self.__rendered_multipliers = (self.lagrange_multipliers, string)
+
+        return string
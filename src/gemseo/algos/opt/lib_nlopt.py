@@ -354,6 +354,7 @@ class Nlopt(OptimizationLibrary):
         Returns:
             The constraint function.
         """
+        require_gradient = self.descriptions[self.algo_name].require_gradient
 
         def cstr_fun_grad(
             xn_vect: ndarray,
@@ -370,7 +371,7 @@ class Nlopt(OptimizationLibrary):
             Returns:
                 The result of evaluating the function for a given constraint.
             """
-            if self.descriptions[self.algo_name].require_gradient and grad.size > 0:
+            if require_gradient and grad.size > 0:
                 cstr_jac = jac(xn_vect)
                 grad[:] = atleast_2d(cstr_jac)[index_cstr,]
             return atleast_1d(func(xn_vect).real)[index_cstr]
@@ -23,6 +23,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from operator import is_not
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Final
@@ -46,8 +47,6 @@ if TYPE_CHECKING:
 
     from numpy import ndarray
 
-    from gemseo.core.mdofunctions.mdo_function import MDOFunction
-
 
 @dataclass
 class OptimizationAlgorithmDescription(DriverDescription):
@@ -135,26 +134,29 @@ class OptimizationLibrary(DriverLibrary):
         self.__kkt_abs_tol = self.__DEFAULT_KKT_ABS_TOL
         self.__kkt_rel_tol = self.__DEFAULT_KKT_REL_TOL
         self.__ref_kkt_norm = None
+        self.__kkt_output_names = []
+        self.__last_kkt_x_vect = None
         self._stop_crit_n_x = self.__DEFAULT_STOP_CRIT_N_X
+        self.__check_x_tol = True
 
-    def __algorithm_handles(self, algo_name: str, eq_constraint: bool):
-        """Check if the algorithm handles equality or inequality constraints.
+    def __get_description(self, algo_name: str) -> OptimizationAlgorithmDescription:
+        """Return the description of an algorithm.
 
         Args:
             algo_name: The name of the algorithm.
-            eq_constraint: Whether the constraints are equality ones.
 
         Returns:
-            Whether the algorithm handles the passed type of constraints.
+            The description of the algorithm.
+
+        Raises:
+            KeyError: When the algorithm is not in the library.
         """
-        if algo_name not in self.descriptions:
+        description = self.descriptions.get(algo_name)
+        if description is None:
             msg = f"Algorithm {algo_name} not in library {self.__class__.__name__}."
             raise KeyError(msg)
 
-        if eq_constraint:
-            return self.descriptions[algo_name].handle_equality_constraints
-
-        return self.descriptions[algo_name].handle_inequality_constraints
+        return description
 
     def check_equality_constraint_support(self, algo_name: str) -> bool:
         """Check if an algorithm handles equality constraints.
@@ -165,7 +167,7 @@ class OptimizationLibrary(DriverLibrary):
         Returns:
             Whether the algorithm handles equality constraints.
         """
-        return self.__algorithm_handles(algo_name, True)
+        return self.__get_description(algo_name).handle_equality_constraints
 
     def check_inequality_constraint_support(self, algo_name: str) -> bool:
         """Check if an algorithm handles inequality constraints.
@@ -176,7 +178,7 @@ class OptimizationLibrary(DriverLibrary):
         Returns:
             Whether the algorithm handles inequality constraints.
         """
-        return self.__algorithm_handles(algo_name, False)
+        return self.__get_description(algo_name).handle_inequality_constraints
 
     def check_positivity_constraint_requirement(self, algo_name: str) -> bool:
         """Check if an algorithm requires positivity constraints.
@@ -193,18 +195,19 @@ class OptimizationLibrary(DriverLibrary):
         self, algo_name: str, problem: OptimizationProblem
     ) -> None:
         """Check if problem and algorithm are consistent for constraints handling."""
-        if problem.has_eq_constraints() and not self.check_equality_constraint_support(
-            algo_name
-        ):
+        has_eq_constraints = problem.has_eq_constraints()
+        has_ineq_constraints = problem.has_ineq_constraints()
+        if not (has_eq_constraints or has_ineq_constraints):
+            return
+
+        description = self.__get_description(algo_name)
+        if has_eq_constraints and not description.handle_equality_constraints:
             msg = (
                 "Requested optimization algorithm "
                 f"{algo_name} can not handle equality constraints."
             )
             raise ValueError(msg)
-        if (
-            problem.has_ineq_constraints()
-            and not self.check_inequality_constraint_support(algo_name)
-        ):
+        if has_ineq_constraints and not description.handle_inequality_constraints:
             msg = (
                 "Requested optimization algorithm "
                 f"{algo_name} can not handle inequality constraints."
@@ -261,6 +264,12 @@ class OptimizationLibrary(DriverLibrary):
         self._stop_crit_n_x = options.get(
             self.STOP_CRIT_NX, self.__DEFAULT_STOP_CRIT_N_X
         )
+        # The database cannot store the same design point twice,
+        # so the null tolerances on the design variables can only be reached
+        # from a single point.
+        self.__check_x_tol = (
+            self._xtol_rel > 0.0 or self._xtol_abs > 0.0 or self._stop_crit_n_x < 2
+        )
         self.__kkt_abs_tol = options.get(self._KKT_TOL_ABS, None)
         self.__kkt_rel_tol = options.get(self._KKT_TOL_REL, None)
         self.init_iter_observer(max_iter)
@@ -268,12 +277,22 @@ class OptimizationLibrary(DriverLibrary):
         if (
             self.__kkt_abs_tol is not None or self.__kkt_rel_tol is not None
         ) and require_gradient:
+            function_names = [
+                problem.get_objective_name(),
+                *problem.get_constraint_names(),
+            ]
+            self.__kkt_output_names = [
+                *function_names,
+                *map(problem.database.get_gradient_name, function_names),
+            ]
+            self.__last_kkt_x_vect = None
             problem.add_callback(
                 self._check_kkt_from_database, each_new_iter=False, each_store=True
             )
-        problem.design_space.initialize_missing_current_values()
+        design_space = problem.design_space
+        design_space.initialize_missing_current_values()
         if problem.differentiation_method == self.DifferentiationMethod.COMPLEX_STEP:
-            problem.design_space.to_complex()
+            design_space.to_complex()
         # First, evaluate all functions at x_0. Some algorithms don't do this
         function_values, _ = self.problem.evaluate_functions(
             eval_jac=require_gradient,
@@ -285,23 +304,7 @@ class OptimizationLibrary(DriverLibrary):
         )
         scaling_threshold = options.get(self.SCALING_THRESHOLD)
         if scaling_threshold is not None:
-            self.problem.objective = self.__scale(
-                self.problem.objective,
-                function_values[self.problem.objective.name],
-                scaling_threshold,
-            )
-            self.problem.constraints = [
-                self.__scale(
-                    constraint, function_values[constraint.name], scaling_threshold
-                )
-                for constraint in self.problem.constraints
-            ]
-            self.problem.observables = [
-                self.__scale(
-                    observable, function_values[observable.name], scaling_threshold
-                )
-                for observable in self.problem.observables
-            ]
+            self.__scale_functions(function_values, scaling_threshold)
 
     @classmethod
     def _get_unsuitability_reason(
@@ -314,20 +317,20 @@ class OptimizationLibrary(DriverLibrary):
             return reason
 
         if (
-            problem.has_eq_constraints()
-            and not algorithm_description.handle_equality_constraints
+            not algorithm_description.handle_equality_constraints
+            and problem.has_eq_constraints()
         ):
             return _UnsuitabilityReason.EQUALITY_CONSTRAINTS
 
         if (
-            problem.has_ineq_constraints()
-            and not algorithm_description.handle_inequality_constraints
+            not algorithm_description.handle_inequality_constraints
+            and problem.has_ineq_constraints()
         ):
             return _UnsuitabilityReason.INEQUALITY_CONSTRAINTS
 
         if (
-            problem.pb_type == problem.ProblemType.NON_LINEAR
-            and algorithm_description.problem_type == problem.ProblemType.LINEAR
+            algorithm_description.problem_type == problem.ProblemType.LINEAR
+            and problem.pb_type == problem.ProblemType.NON_LINEAR
         ):
             return _UnsuitabilityReason.NON_LINEAR_PROBLEM
 
@@ -349,7 +352,7 @@ class OptimizationLibrary(DriverLibrary):
         ):
             raise FtolReached
 
-        if is_x_tol_reached(
+        if self.__check_x_tol and is_x_tol_reached(
             self.problem, self._xtol_rel, self._xtol_abs, self._stop_crit_n_x
         ):
             raise XtolReached
@@ -360,27 +363,27 @@ class OptimizationLibrary(DriverLibrary):
         Raises:
             KKTReached: If the absolute tolerance on the KKT residual is reached.
         """
-        check_kkt = True
-        function_names = [
-            self.problem.get_objective_name(),
-            *self.problem.get_constraint_names(),
-        ]
         database = self.problem.database
-        for function_name in function_names:
-            if (
-                database.get_function_value(
-                    database.get_gradient_name(function_name), x_vect
-                )
-                is None
-            ) or (database.get_function_value(function_name, x_vect) is None):
-                check_kkt = False
-                break
-        if check_kkt and (self.__ref_kkt_norm is None):
+        # Hash x_vect once to get all its outputs rather than once per output name.
+        hashed_x_vect = database.get_hashable_ndarray(x_vect)
+        if hashed_x_vect == self.__last_kkt_x_vect:
+            # The KKT residual has already been checked at this point.
+            return
+
+        outputs = database.get(hashed_x_vect)
+        if outputs is None or any(
+            outputs.get(output_name) is None for output_name in self.__kkt_output_names
+        ):
+            return
+
+        self.__last_kkt_x_vect = database.get_hashable_ndarray(hashed_x_vect, True)
+
+        if self.__ref_kkt_norm is None:
             self.__ref_kkt_norm = kkt_residual_computation(
                 self.problem, x_vect, self.__ineq_tolerance
             )
 
-        if check_kkt and is_kkt_residual_norm_reached(
+        if is_kkt_residual_norm_reached(
             self.problem,
             x_vect,
             kkt_abs_tol=self.__kkt_abs_tol,
@@ -390,31 +393,59 @@ class OptimizationLibrary(DriverLibrary):
         ):
             raise KKTReached
 
-    @staticmethod
-    def __scale(
-        function: MDOFunction,
-        function_value: Mapping[str, ndarray],
+    def __scale_functions(
+        self,
+        function_values: Mapping[str, ndarray],
         scaling_threshold: float,
-    ) -> MDOFunction:
-        """Scale a function based on its value on the current design values.
+    ) -> None:
+        """Scale the functions of the problem from their values at the current point.
+
+        The divisors of all the functions are computed at once
+        from the concatenation of their reference values.
 
         Args:
-            function: The function.
-            function_value: The function value of reference for scaling.
-            scaling_threshold: The threshold on the reference function value
+            function_values: The function values of reference for scaling.
+            scaling_threshold: The threshold on the reference function values
                 that triggers scaling.
-
-        Returns:
-            The scaled function.
         """
-        reference_values = numpy.absolute(function_value)
-        threshold_reached = reference_values > scaling_threshold
-        if not threshold_reached.any():
-            return function
-
-        scaled_function = function / numpy.where(
-            threshold_reached, reference_values, 1.0
+        problem = self.problem
+        functions = [problem.objective, *problem.constraints, *problem.observables]
+        values = [function_values[function.name] for function in functions]
+        divisors = numpy.absolute(
+            numpy.concatenate([numpy.ravel(value) for value in values])
         )
-        # Use same function name for consistency with name used in database
-        scaled_function.name = function.name
-        return scaled_function
+        # A single reduction detects the most common case where nothing is scaled.
+        if divisors.max() <= scaling_threshold:
+            return
+
+        # NaN reference values do not trigger scaling.
+        threshold_not_reached = numpy.greater(divisors, scaling_threshold)
+        numpy.logical_not(threshold_not_reached, out=threshold_not_reached)
+        numpy.copyto(divisors, 1.0, where=threshold_not_reached)
+        scaled_functions = []
+        start = 0
+        for function, value in zip(functions, values):
+            end = start + numpy.size(value)
+            if not threshold_not_reached[start:end].all():
+                scaled_function = function / divisors[start:end].reshape(
+                    numpy.shape(value)
+                )
+                # Use same function name for consistency with name used in database
+                scaled_function.name = function.name
+                function = scaled_function
+
+            scaled_functions.append(function)
+            start = end
+
+        # Replace only the functions and lists that have actually been scaled.
+        n_constraints = len(problem.constraints)
+        if scaled_functions[0] is not problem.objective:
+            problem.objective = scaled_functions[0]
+
+        constraints = scaled_functions[1 : 1 + n_constraints]
+        if any(map(is_not, constraints, problem.constraints)):
+            problem.constraints = constraints
+
+        observables = scaled_functions[1 + n_constraints :]
+        if any(map(is_not, observables, problem.observables)):
+            problem.observables = observables
@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import cast
 
 from numpy import array
@@ -34,6 +35,22 @@ from gemseo.typing import StrKeyMapping
 from gemseo.utils.platform import PLATFORM_IS_WINDOWS
 
 
+@lru_cache(maxsize=1024)
+def _hash_name(name: str) -> str:
+    """Hash a name using xxh3_64 from the xxhash library.
+
+    The names of the data are few and hashed at each call to :func:`.hash_data`,
+    so the hashes of the most recently used ones are cached.
+
+    Args:
+        name: The name to hash.
+
+    Returns:
+        The hexadecimal hash value of the name.
+    """
+    return xxh3_64_hexdigest(bytes(name, "utf-8"))
+
+
 def hash_data(
     data: StrKeyMapping,
 ) -> int:
@@ -75,8 +92,7 @@ def hash_data(
         value = value.view(uint8)
 
         hashed_value = xxh3_64_hexdigest(value)  # type: ignore
-        hashed_name = xxh3_64_hexdigest(bytes(name, "utf-8"))
-        names_with_hashed_values.append((hashed_name, hashed_value))
+        names_with_hashed_values.append((_hash_name(name), hashed_value))
 
     return int(xxh3_64_hexdigest(array(names_with_hashed_values)), 16)  # type: ignore
 
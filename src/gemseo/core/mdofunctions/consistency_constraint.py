@@ -56,6 +56,8 @@ class ConsistencyCstr(LinearCandidateFunction):
         """  # noqa: D205, D212, D415
         self.__formulation = formulation
         self.__output_couplings = output_couplings
+        self.__x_mask = None
+        self.__x_mask_layout = ()
         self.__coupl_func = FunctionFromDiscipline(
             self.__output_couplings, self.__formulation
         )
@@ -103,7 +105,19 @@ class ConsistencyCstr(LinearCandidateFunction):
             The value of the consistency constraints.
             Equal to zero if the disciplines are at equilibrium.
         """
-        x_sw = self.__formulation.mask_x_swap_order(self.__output_couplings, x_vect)
+        # The mask is built again when the variables of the design space
+        # are added, removed, resized or reordered.
+        design_space = self.__formulation.design_space
+        variable_sizes = design_space.variable_sizes
+        layout = tuple(
+            (name, variable_sizes[name]) for name in design_space.variable_names
+        )
+        if self.__x_mask is None or layout != self.__x_mask_layout:
+            self.__x_mask = self.__formulation.get_x_mask_x_swap_order(
+                self.__output_couplings
+            )
+            self.__x_mask_layout = layout
+        x_sw = x_vect[self.__x_mask]
         coupl = self.__coupl_func(x_vect)
         if self.__formulation.normalize_constraints:
             return (coupl - x_sw) / self.__norm_fact
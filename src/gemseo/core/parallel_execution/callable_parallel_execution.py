@@ -50,7 +50,6 @@ if TYPE_CHECKING:
     from multiprocessing.context import ForkProcess
     from multiprocessing.context import ForkServerProcess
     from multiprocessing.context import SpawnProcess
-    from multiprocessing.managers import ListProxy
 
 SUBPROCESS_NAME: Final[str] = "subprocess"
 
@@ -261,8 +260,6 @@ class CallableParallelExecution(
 
         n_tasks = len(inputs)
 
-        tasks: list[int] | ListProxy[int] = list(range(n_tasks))[::-1]
-
         queue_in: _QueueInType[ArgT]
         queue_out: _QueueOutType[ReturnT]
         processor: (
@@ -282,7 +279,6 @@ class CallableParallelExecution(
             manager = get_multi_processing_manager()
             queue_in = manager.Queue()
             queue_out = manager.Queue()
-            tasks = manager.list(tasks)
             self.__check_multiprocessing_start_method()
             processor = get_context(method=self.MULTI_PROCESSING_START_METHOD).Process  # type: ignore[attr-defined]
 
@@ -304,8 +300,9 @@ class CallableParallelExecution(
             return []
 
         # Fill the input queue.
-        while tasks:
-            task_index = tasks.pop()
+        # Only the calling process submits the tasks,
+        # so their indices do not need to be shared through the manager.
+        for task_index in range(n_tasks):
             # Delay the next processes execution after the first one.
             if self.wait_time_between_fork > 0 and task_index > 0:
                 time.sleep(self.wait_time_between_fork)
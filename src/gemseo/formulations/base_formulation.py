@@ -23,15 +23,17 @@ from __future__ import annotations
 
 import logging
 from abc import abstractmethod
+from collections.abc import Collection
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import ClassVar
 
 from numpy import arange
+from numpy import array
 from numpy import copy
-from numpy import empty
-from numpy import in1d
+from numpy import fromiter
 from numpy import ndarray
+from numpy import repeat
 from numpy import zeros
 
 from gemseo.algos.optimization_problem import OptimizationProblem
@@ -227,20 +229,31 @@ class BaseFormulation(metaclass=ABCGoogleDocstringInheritanceMeta):
     def _get_mask_from_datanames(
         all_data_names: ndarray,
         masked_data_names: ndarray,
-    ) -> ndarray:
+    ) -> tuple[ndarray]:
         """Get a mask of all_data_names for masked_data_names.
 
-        This mask is an array of the size of ``all_data_names``
-        with ``True`` values when masked_data_names are in ``all_data_names``.
+        This mask contains the indices of the elements of ``all_data_names``
+        that are in ``masked_data_names``,
+        wrapped in a 1-length tuple as returned by :func:`numpy.nonzero`.
 
         Args:
             all_data_names: The main array for mask.
             masked_data_names: The array which masks ``all_data_names``.
 
         Returns:
-            A boolean mask array.
+            The indices of the masked elements of ``all_data_names``.
         """
-        return in1d(all_data_names, masked_data_names).nonzero()
+        masked_data_names = set(masked_data_names)
+        return (
+            fromiter(
+                (
+                    index
+                    for index, name in enumerate(all_data_names)
+                    if name in masked_data_names
+                ),
+                dtype=int,
+            ),
+        )
 
     def _get_generator_from(
         self,
@@ -356,6 +369,8 @@ class BaseFormulation(metaclass=ABCGoogleDocstringInheritanceMeta):
         x_masked: ndarray,
         all_data_names: Iterable[str] | None = None,
         x_full: ndarray | None = None,
+        *,
+        inplace: bool = False,
     ) -> ndarray:
         """Unmask a vector from a subset of names, with respect to a set of names.
 
@@ -369,6 +384,9 @@ class BaseFormulation(metaclass=ABCGoogleDocstringInheritanceMeta):
                 If ``None``, use the design variables stored in the design space.
             x_full: The default values for the full vector.
                 If ``None``, use the zero vector.
+            inplace: Whether to write the masked values directly into ``x_full``
+                and return it, instead of working on a copy of ``x_full``.
+                This argument is ignored when ``x_full`` is ``None``.
 
         Returns:
             The vector related to the input mask.
@@ -379,27 +397,35 @@ class BaseFormulation(metaclass=ABCGoogleDocstringInheritanceMeta):
         if not all_data_names:
             all_data_names = self.get_optim_variable_names()
         indices = self._get_dv_indices(all_data_names)
-        variable_sizes = self.optimization_problem.design_space.variable_sizes
-        total_size = sum(variable_sizes[var] for var in all_data_names)
 
         # TODO: The support of sparse Jacobians requires modifications here.
         if x_full is None:
+            total_size = sum(size for _, _, size in indices.values())
             x_unmask = zeros(total_size, dtype=x_masked.dtype)
+        elif inplace:
+            x_unmask = x_full
         else:
             x_unmask = copy(x_full)
 
-        i_x = 0
+        masking_data_names = set(masking_data_names)
+        masked_indices = array(
+            [value for key, value in indices.items() if key in masking_data_names],
+            dtype=int,
+        ).reshape(-1, 3)
+        x_indices = self.__concatenate_ranges(
+            masked_indices[:, 0], masked_indices[:, 2]
+        )
+        msg = (
+            "Inconsistent input array size of values array "
+            f"with reference data shape {x_unmask.shape}"
+        )
+        # A too short x_masked would be broadcast by the assignment.
+        if x_masked.size < x_indices.size:
+            raise ValueError(msg)
+
         try:
-            for key in all_data_names:
-                if key in masking_data_names:
-                    i_min, i_max, n_x = indices[key]
-                    x_unmask[i_min:i_max] = x_masked[i_x : i_x + n_x]
-                    i_x += n_x
+            x_unmask[x_indices] = x_masked[: x_indices.size]
         except IndexError:
-            msg = (
-                "Inconsistent input array size of values array "
-                f"with reference data shape {x_unmask.shape}"
-            )
             raise ValueError(msg) from None
         return x_unmask
 
@@ -454,17 +480,14 @@ class BaseFormulation(metaclass=ABCGoogleDocstringInheritanceMeta):
         if not all_data_names:
             all_data_names = design_space.variable_names
 
+        if not isinstance(masking_data_names, Collection):
+            masking_data_names = tuple(masking_data_names)
+
         variable_sizes = design_space.variable_sizes
-        total_size = sum(variable_sizes[var] for var in masking_data_names)
+        sizes = array([variable_sizes[key] for key in masking_data_names], dtype=int)
         indices = self._get_dv_indices(all_data_names)
-        x_mask = empty(total_size, dtype="int")
-        i_masked_min = i_masked_max = 0
         try:
-            for key in masking_data_names:
-                i_min, i_max, loc_size = indices[key]
-                i_masked_max += loc_size
-                x_mask[i_masked_min:i_masked_max] = arange(i_min, i_max)
-                i_masked_min = i_masked_max
+            starts = array([indices[key][0] for key in masking_data_names], dtype=int)
         except KeyError as err:
             msg = (
                 "Inconsistent inputs of masking. "
@@ -473,7 +496,22 @@ class BaseFormulation(metaclass=ABCGoogleDocstringInheritanceMeta):
             )
             raise ValueError(msg) from None
 
-        return x_mask
+        return self.__concatenate_ranges(starts, sizes)
+
+    @staticmethod
+    def __concatenate_ranges(starts: ndarray, sizes: ndarray) -> ndarray:
+        """Concatenate integer ranges.
+
+        Args:
+            starts: The first integers of the ranges.
+            sizes: The sizes of the ranges.
+
+        Returns:
+            The concatenation of the ranges ``[start, start + size)``.
+        """
+        # The i-th range starts at sizes[:i].sum() in the concatenation.
+        range_starts = sizes.cumsum() - sizes
+        return arange(sizes.sum()) + repeat(starts - range_starts, sizes)
 
     def _remove_unused_variables(self) -> None:
         """Remove variables in the design space that are not discipline inputs."""
@@ -553,7 +591,7 @@ class BaseFormulation(metaclass=ABCGoogleDocstringInheritanceMeta):
              The names of the design variables.
         """
         optim_variable_names = self.get_optim_variable_names()
-        input_names = discipline.get_input_data_names()
+        input_names = set(discipline.get_input_data_names())
         return [name for name in optim_variable_names if name in input_names]
 
     def get_sub_disciplines(self, recursive: bool = False) -> list[MDODiscipline]:
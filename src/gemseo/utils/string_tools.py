@@ -201,6 +201,15 @@ class MultiLineString:
         """
         self.__lines.append(MessageLine(str_format, self.__level, args, kwargs))
 
+    def extend(self, lines: Iterable[str]) -> None:
+        """Add several lines without format arguments at the current indentation.
+
+        Args:
+            lines: The lines.
+        """
+        level = self.__level
+        self.__lines.extend(MessageLine(line, level, (), {}) for line in lines)
+
     @property
     def lines(self) -> list[MessageLine]:
         """The strings composing the lines."""
@@ -28,6 +28,9 @@ from typing import TYPE_CHECKING
 
 import pytest
 from numpy import array
+from numpy import asfortranarray
+from numpy import integer
+from numpy import issubdtype
 from numpy import ndarray
 from numpy.testing import assert_array_equal
 from numpy.testing import assert_equal
@@ -37,6 +40,7 @@ from gemseo import create_scenario
 from gemseo import execute_algo
 from gemseo.algos.database import Database
 from gemseo.algos.design_space import DesignSpace
+from gemseo.algos.doe.doe_library import DOELibrary
 from gemseo.algos.doe.factory import DOELibraryFactory
 from gemseo.algos.doe.lib_custom import CustomDOE
 from gemseo.algos.doe.lib_openturns import OpenTURNS
@@ -416,15 +420,26 @@ def test_compute_doe():
     assert_equal(CustomDOE().compute_doe(3, samples=samples), samples)
 
 
+def test_contiguous_samples():
+    """Check that the samples are stored row by row."""
+    library = CustomDOE()
+    samples = asfortranarray([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]])
+    library.execute(Power2(), samples=samples)
+    assert library.unit_samples.flags.c_contiguous
+    assert library.samples.flags.c_contiguous
+
+
 def test_serialize(tmp_wd):
     """Verify that DOELibrary is serializable."""
     lib = CustomDOE()
+    lib._DOELibrary__hashable_samples = [array([1.0])]
+    assert "_DOELibrary__hashable_samples" not in lib.__getstate__()
     output_path = Path("out.pk")
     with open(output_path, "wb") as outf:
         pickle.dump(lib, outf)
 
     with open(output_path, "rb") as outf:
-        pickle.load(outf)
+        assert pickle.load(outf)._DOELibrary__hashable_samples == []
 
 
 class _DummyDisc(MDODiscipline):
@@ -491,3 +506,125 @@ def test_parallel_doe_db(tmp_wd):
         f_s = db_ser.get_function_history(func, with_x_vect=False)
         f_p = db_par.get_function_history(func, with_x_vect=False)
         assert_array_equal(f_p, f_s, strict=True)
+
+
+class _DTypeDisc(MDODiscipline):
+    """A discipline returning whether its input ``n`` has an integer dtype."""
+
+    def __init__(self) -> None:
+        super().__init__("dtype", grammar_type=MDODiscipline.GrammarType.SIMPLE)
+        self.input_grammar.update_from_types({"x": ndarray, "n": ndarray})
+        self.output_grammar.update_from_types({"y": ndarray, "n_is_integer": ndarray})
+
+    def _run(self):
+        self.local_data["y"] = self.local_data["x"] + self.local_data["n"]
+        self.local_data["n_is_integer"] = array([
+            float(issubdtype(self.local_data["n"].dtype, integer))
+        ])
+
+
+@pytest.mark.parametrize("n_processes", [1, 2])
+def test_integer_input_dtype(n_processes):
+    """Check that the integer inputs have the same dtype in serial and parallel."""
+    design_space = DesignSpace()
+    design_space.add_variable("x", l_b=0.0, u_b=1.0)
+    design_space.add_variable("n", var_type="integer", l_b=0, u_b=3)
+    scenario = create_scenario(
+        [_DTypeDisc()], "DisciplinaryOpt", "y", design_space, scenario_type="DOE"
+    )
+    scenario.add_observable("n_is_integer")
+    scenario.execute({
+        "algo": "fullfact",
+        "n_samples": 4,
+        "algo_options": {"n_processes": n_processes},
+    })
+    history = scenario.formulation.optimization_problem.database.get_function_history(
+        "n_is_integer"
+    )
+    assert_equal(history, array([1.0] * 4))
+
+
+def _compute_lhs(library=None):
+    """Compute a LHS with a PyDOE library.
+
+    Args:
+        library: The PyDOE library; if ``None``, create a new one.
+
+    Returns:
+        The samples in the unit hypercube.
+    """
+    if library is None:
+        library = PyDOE()
+
+    library.algo_name = "lhs"
+    return library.compute_doe(2, n_samples=3)
+
+
+@pytest.fixture()
+def unit_samples_cache(monkeypatch):
+    """Activate the cache of the unit samples, empty before and after the test."""
+    monkeypatch.setattr(DOELibrary, "activate_unit_samples_cache", True)
+    cache = DOELibrary._DOELibrary__UNIT_SAMPLES_CACHE
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def test_unit_samples_cache(unit_samples_cache):
+    """Check that the unit samples are reused without changing the seeds."""
+    unit_samples = _compute_lhs()
+    library = PyDOE()
+    other_unit_samples = _compute_lhs(library)
+    assert_equal(other_unit_samples, unit_samples)
+    assert library.seed == 1
+    # The cached samples cannot be modified from the outside.
+    other_unit_samples[0, 0] = 2.0
+    assert_equal(_compute_lhs(), unit_samples)
+    # The seed has been incremented, so the samples are new.
+    assert (_compute_lhs(library) != unit_samples).any()
+
+
+def test_unit_samples_cache_deactivated():
+    """Check that the unit samples are not cached by default."""
+    cache = DOELibrary._DOELibrary__UNIT_SAMPLES_CACHE
+    cache.clear()
+    _compute_lhs()
+    assert not cache
+
+
+def test_unit_samples_cache_large_array(unit_samples_cache):
+    """Check that the unit samples larger than 1 MiB are not cached."""
+    library = PyDOE()
+    library.algo_name = "lhs"
+    library.compute_doe(2, n_samples=2**16 + 1)
+    assert not unit_samples_cache
+
+
+def fail_above_half(x):
+    """Return x if lower than or equal to 0.5, otherwise raise a ValueError."""
+    if x[0] > 0.5:
+        raise ValueError
+    return x
+
+
+def test_parallel_duplicated_failed_sample():
+    """Check that a failed sample appearing twice in a parallel DOE is removed."""
+    design_space = DesignSpace()
+    design_space.add_variable("x")
+    problem = OptimizationProblem(design_space)
+    problem.objective = MDOFunction(fail_above_half, "f")
+    library = CustomDOE()
+    library.execute(problem, samples=array([[0.1], [0.9], [0.9], [0.2]]), n_processes=2)
+    assert len(problem.database) == 2
+    assert library._DOELibrary__hashable_samples == []
+
+
+def test_unit_samples_not_cached_for_openturns(unit_samples_cache):
+    """Check that OpenTURNS sets its global seed at each generation."""
+    openturns = pytest.importorskip("openturns")
+    library = OpenTURNS()
+    library.algo_name = "OT_MONTE_CARLO"
+    library.compute_doe(2, n_samples=3, seed=2)
+    value = openturns.RandomGenerator.Generate()
+    library.compute_doe(2, n_samples=3, seed=2)
+    assert_equal(openturns.RandomGenerator.Generate(), value)
@@ -19,18 +19,22 @@
 from __future__ import annotations
 
 import re
+from io import StringIO
 from logging import ERROR
 from pathlib import Path
 from typing import Any
 
 import pytest
 from numpy import array
+from numpy import save
 from numpy.testing import assert_equal
 from pandas.errors import ParserError
 
 from gemseo.algos.design_space import DesignSpace
 from gemseo.algos.doe.factory import DOELibraryFactory
 from gemseo.algos.doe.lib_custom import CustomDOE
+from gemseo.algos.optimization_problem import OptimizationProblem
+from gemseo.core.mdofunctions.mdo_function import MDOFunction
 
 from .utils import execute_problem
 from .utils import generate_test_functions
@@ -210,3 +214,42 @@ def test_malformed_file(caplog):
     _, level, message = caplog.record_tuples[0]
     assert level == ERROR
     assert re.match(r"Failed to load the DOE file .+malformed_doe\.csv", message)
+
+
+def test_read_file_whitespace():
+    """Check that CustomDOE.read_file splits on whitespace when delimiter is None."""
+    assert_equal(
+        CustomDOE.read_file(StringIO("1.0  2.0\n3.0\t4.0\n"), delimiter=None),
+        array([[1.0, 2.0], [3.0, 4.0]]),
+    )
+
+
+def test_read_npy_file(tmp_wd):
+    """Check that CustomDOE reads the samples from a NumPy binary file."""
+    samples = array([[1.0, 2.0], [3.0, 4.0]])
+    save("doe.npy", samples)
+    assert_equal(CustomDOE().compute_doe(2, doe_file="doe.npy"), samples)
+
+
+def test_execute_npy_file(tmp_wd):
+    """Check that a DOE is executed from a NumPy binary file."""
+    samples = array([[1.0, 2.0], [3.0, 4.0]])
+    save("doe.npy", samples)
+    design_space = DesignSpace()
+    design_space.add_variable("x", size=2)
+    problem = OptimizationProblem(design_space)
+    problem.objective = MDOFunction(sum, "f")
+    CustomDOE().execute(problem, doe_file="doe.npy")
+    assert_equal(problem.database.get_x_vect_history(), list(samples))
+    assert_equal(problem.database.get_function_history("f"), array([3.0, 7.0]))
+
+
+def test_read_1d_npy_file(tmp_wd):
+    """Check that a 1D NumPy binary file is read as a single column."""
+    save("doe.npy", array([1.0, 2.0]))
+    assert_equal(CustomDOE().compute_doe(1, doe_file="doe.npy"), array([[1.0], [2.0]]))
+    with pytest.raises(
+        ValueError,
+        match=re.escape("Dimension mismatch between the variables space (2) "),
+    ):
+        CustomDOE().compute_doe(2, doe_file="doe.npy")
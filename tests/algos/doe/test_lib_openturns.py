@@ -232,6 +232,7 @@ def variables_space():
     design_space.dimension = 2
     design_space.untransform_vect = lambda doe, no_check: doe
     design_space.normalize = {"x": array([True, True])}
+    design_space._unnormalized_components = array([], dtype=int)
     return design_space
 
 
@@ -450,6 +450,17 @@ def test_remove_empty_entries() -> None:
     assert array([2.0]) in database
 
 
+def test_bulk_store_empty() -> None:
+    """Check that input values can be stored without output values in one go."""
+    database = Database()
+    database.store(array([2.0]), {"f": array([1.0])})
+    database.bulk_store_empty(array([[1.0], [2.0], [3.0]]))
+    assert database.get_x_vect_history() == [array([2.0]), array([1.0]), array([3.0])]
+    assert database[array([1.0])] == {}
+    assert database[array([2.0])] == {"f": array([1.0])}
+    assert database[array([3.0])] == {}
+
+
 def test_get_last_n_x() -> None:
     database = Database()
     database.store(ones(1), {})
@@ -1042,6 +1042,18 @@ def test_project_into_bounds(design_space, normalized, expected) -> None:
     assert norm(x_p - expected) == pytest.approx(0.0)
 
 
+@pytest.mark.parametrize(
+    ("normalized", "expected"), [(False, [-1, 0.5, 2]), (True, [0, 0.5, 1])]
+)
+def test_project_into_bounds_2d(design_space, normalized, expected) -> None:
+    """Tests the projection of several vectors onto the design space bounds."""
+    design_space.filter("x9")
+    x_p = design_space.project_into_bounds(
+        array([[-2, 0.5, 3], [0.5, -2, 3]]), normalized=normalized
+    )
+    assert_equal(x_p, array([expected, [expected[1], expected[0], expected[2]]]))
+
+
 def test_contains(design_space) -> None:
     """Check the DesignSpace.__contains__."""
     assert "x1" in design_space
@@ -1696,3 +1708,26 @@ def test_normalization_runtimewarning() -> None:
     with warnings.catch_warnings():
         warnings.simplefilter("error")
         design_space.normalize_vect(array([1.0, 1.0]))
+
+
+def test_unnormalized_components() -> None:
+    """Check the indices of the unnormalized components and their update."""
+    design_space = DesignSpace()
+    design_space.add_variable("x", size=2, l_b=0.0, u_b=[1.0, 0.0])
+    design_space.add_variable("y", l_b=0.0)
+    assert_equal(design_space._unnormalized_components, array([1, 2]))
+    design_space.set_upper_bound("y", array([1.0]))
+    assert_equal(design_space._unnormalized_components, array([1]))
+    design_space.remove_variable("x")
+    assert_equal(design_space._unnormalized_components, array([], dtype=int))
+
+
+def test_integer_variable_names() -> None:
+    """Check the names of the integer variables and their update."""
+    design_space = DesignSpace()
+    design_space.add_variable("x", var_type="integer")
+    design_space.add_variable("y")
+    design_space.add_variable("z", var_type="integer")
+    assert design_space._integer_variable_names == ("x", "z")
+    design_space.remove_variable("x")
+    assert design_space._integer_variable_names == ("z",)
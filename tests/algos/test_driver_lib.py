@@ -226,6 +226,14 @@ def test_get_x0_and_bounds_vects_non_normalized(
     )
 
 
+def test_ensure_bounds_after_bounds_change(driver_library) -> None:
+    """Check that ensure_bounds uses the current bounds of the design space."""
+    func = driver_library.ensure_bounds(lambda x_vect: x_vect, normalize=False)
+    assert func(array([2.5])) == array([2.5])
+    driver_library.problem.design_space.set_upper_bound("x", array([2.0]))
+    assert func(array([2.5])) == array([2.0])
+
+
 @pytest.mark.parametrize("name", ["new_iter_listener", "store_listener"])
 def test_clear_listeners(name):
     """Check clear_listeners."""
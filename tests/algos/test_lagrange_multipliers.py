@@ -24,6 +24,7 @@ from pathlib import Path
 import numpy as np
 import pytest
 from numpy import array
+from numpy.testing import assert_equal
 
 from gemseo import create_scenario
 from gemseo import execute_algo
@@ -321,3 +322,22 @@ def test_2d_mixed(
         assert lag_approx["inequality"][1] > 0
     else:
         assert lag_approx["equality"][1][0] > 0
+
+
+def test_get_multipliers_arrays_per_variable(problem) -> None:
+    """Check that the bound multipliers are split per design variable."""
+    problem.design_space.add_variable("y", size=2, l_b=0.0, u_b=1.0, value=0.5)
+    lagrange = LagrangeMultipliers(problem)
+    lagrange.lagrange_multipliers = {
+        lagrange.LOWER_BOUNDS: (["x!1", "y!0"], array([1.0, 2.0])),
+        lagrange.UPPER_BOUNDS: (["y!1"], array([3.0])),
+    }
+    multipliers = lagrange.get_multipliers_arrays()
+    assert_equal(
+        multipliers[lagrange.LOWER_BOUNDS],
+        {"x": array([0.0, 1.0, 0.0]), "y": array([2.0, 0.0])},
+    )
+    assert_equal(
+        multipliers[lagrange.UPPER_BOUNDS],
+        {"x": array([0.0, 0.0, 0.0]), "y": array([0.0, 3.0])},
+    )
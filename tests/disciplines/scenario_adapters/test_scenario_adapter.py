@@ -455,6 +455,27 @@ def test_lagrange_multipliers_outputs() -> None:
     assert allclose(lagr_grad, zeros_like(lagr_grad))
 
 
+def test_bound_multipliers_outputs_per_variable() -> None:
+    """Check that the bound multipliers have the size of their design variable."""
+    design_space = SobieskiDesignSpace().filter(["x_1", "x_shared"], copy=True)
+    scenario = MDOScenario(
+        [SobieskiStructure()],
+        "DisciplinaryOpt",
+        "y_11",
+        design_space,
+        maximize_objective=True,
+    )
+    scenario.add_constraint("g_1", constraint_type="ineq")
+    scenario.default_inputs = {"max_iter": 5, "algo": "NLOPT_SLSQP"}
+    adapter = MDOScenarioAdapter(scenario, ["y_31"], ["y_11"], output_multipliers=True)
+    adapter.execute()
+    for name in ["x_1", "x_shared"]:
+        size = design_space.get_size(name)
+        for is_upper in [False, True]:
+            mult_name = MDOScenarioAdapter.get_bnd_mult_name(name, is_upper)
+            assert adapter.local_data[mult_name].shape == (size,)
+
+
 @pytest.mark.parametrize("export_name", ["", "local_database"])
 def test_keep_opt_history(tmp_wd, scenario, export_name) -> None:
     """Test the option that keeps the local history of sub optimizations, with and
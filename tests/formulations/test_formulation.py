@@ -20,11 +20,13 @@
 from __future__ import annotations
 
 import math
+import re
 import unittest
 
 import numpy as np
 import pytest
 from numpy.linalg import norm
+from numpy.testing import assert_equal
 
 from gemseo.algos.design_space import DesignSpace
 from gemseo.core.chain import MDOChain
@@ -295,3 +297,63 @@ def test_get_generator_with_inputs(top_level_disc) -> None:
     generator = formulation._get_generator_with_inputs("x", top_level_disc)
     assert generator.discipline == discipline
     assert generator._MDODisciplineAdapterGenerator__names_to_sizes == {"x": 1}
+
+
+@pytest.mark.parametrize("inplace", [False, True])
+def test_unmask_x_swap_order_inplace(inplace) -> None:
+    """Check that unmask_x_swap_order writes into x_full only when inplace."""
+    design_space = DesignSpace()
+    design_space.add_variable("x", 2)
+    design_space.add_variable("y")
+    with concretize_classes(MDOFormulation):
+        formulation = MDOFormulation(
+            [AnalyticDiscipline({"z": "x+y"})], "z", design_space
+        )
+
+    x_full = np.array([1.0, 2.0, 3.0])
+    x_unmask = formulation.unmask_x_swap_order(
+        ["y"], np.array([4.0]), x_full=x_full, inplace=inplace
+    )
+    assert_equal(x_unmask, np.array([1.0, 2.0, 4.0]))
+    assert (x_unmask is x_full) is inplace
+    assert_equal(x_full, np.array([1.0, 2.0, 4.0 if inplace else 3.0]))
+
+
+@pytest.mark.parametrize("x_masked", [np.array([4.0]), np.array([4.0, 5.0])])
+def test_unmask_x_swap_order_too_short(x_masked) -> None:
+    """Check that unmask_x_swap_order raises when x_masked is too short."""
+    design_space = DesignSpace()
+    design_space.add_variable("x", 2)
+    design_space.add_variable("y")
+    with concretize_classes(MDOFormulation):
+        formulation = MDOFormulation(
+            [AnalyticDiscipline({"z": "x+y"})], "z", design_space
+        )
+
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Inconsistent input array size of values array "
+            "with reference data shape (3,)"
+        ),
+    ):
+        formulation.unmask_x_swap_order(["x", "y"], x_masked)
+
+
+def test_mask_x_swap_order_from_generators() -> None:
+    """Check that the mask routines accept names passed as generators."""
+    design_space = DesignSpace()
+    design_space.add_variable("x", 2)
+    design_space.add_variable("y")
+    with concretize_classes(MDOFormulation):
+        formulation = MDOFormulation(
+            [AnalyticDiscipline({"z": "x+y"})], "z", design_space
+        )
+
+    x_vect = np.array([1.0, 2.0, 3.0])
+    masked = formulation.mask_x_swap_order((name for name in ["y", "x"]), x_vect)
+    assert (masked == np.array([3.0, 1.0, 2.0])).all()
+    unmasked = formulation.unmask_x_swap_order(
+        (name for name in ["y"]), np.array([4.0]), (name for name in ["x", "y"])
+    )
+    assert (unmasked == np.array([0.0, 0.0, 4.0])).all()
@@ -66,6 +66,32 @@ def test_build_func_from_disc() -> None:
         func.check_grad(x_vect, "ComplexStep", 1e-30, error_max=1e-4)
 
 
+@pytest.mark.parametrize("z_size", [1, 2])
+def test_consistency_constraint_after_design_space_change(z_size) -> None:
+    """Check that the consistency constraint follows a changed design space.
+
+    Moving ``z`` after ``y1`` reorders the design space and, when ``z_size`` is 2,
+    also changes its dimension.
+    """
+    design_space = DesignSpace()
+    design_space.add_variable("x", value=1.0)
+    design_space.add_variable("y2", value=3.0)
+    design_space.add_variable("z", value=5.0)
+    design_space.add_variable("y1", value=2.0)
+    disciplines = [
+        AnalyticDiscipline({"y1": "x+y2"}),
+        AnalyticDiscipline({"y2": "2*y1"}),
+    ]
+    idf = IDF(disciplines, "y1", design_space, normalize_constraints=False)
+    constraint = ConsistencyCstr(["y1"], idf)
+    assert constraint(np.array([1.0, 3.0, 5.0, 2.0])) == pytest.approx(2.0)
+
+    design_space.remove_variable("z")
+    design_space.add_variable("z", size=z_size, value=5.0)
+    x_vect = np.array([1.0, 3.0, 2.0] + [5.0] * z_size)
+    assert constraint(x_vect) == pytest.approx(2.0)
+
+
 @pytest.mark.parametrize(
     ("options", "expected_feasible"),
     [
@@ -87,6 +87,7 @@ from gemseo import wrap_discipline_in_job_scheduler
 from gemseo import write_design_space
 from gemseo.algos.database import Database
 from gemseo.algos.design_space import DesignSpace
+from gemseo.algos.doe.doe_library import DOELibrary
 from gemseo.algos.driver_library import DriverLibrary
 from gemseo.core.discipline import MDODiscipline
 from gemseo.core.grammars.errors import InvalidDataError
@@ -841,6 +842,7 @@ def test_configure_default() -> None:
     assert MDODiscipline.activate_output_data_check is True
     assert MDODiscipline.activate_cache is True
     assert DriverLibrary.activate_progress_bar is True
+    assert DOELibrary.activate_unit_samples_cache is False
 
 
 def test_algo_features() -> None:
@@ -48,6 +48,15 @@ def test_message() -> None:
     assert str(msg) == expected
 
 
+def test_extend() -> None:
+    """Check the addition of several lines at once."""
+    msg = MultiLineString()
+    msg.add("foo")
+    msg.indent()
+    msg.extend(["bar", "{}"])
+    assert str(msg) == "foo\n   bar\n   {}"
+
+
 def test_message_with_offset() -> None:
     with MultiLineString.offset():
         msg = MultiLineString()